@@ -7,11 +7,15 @@ import time
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
 from urllib.parse import urlparse
-import urllib.request
 import random
 from io import BytesIO
 import base64
 import re
+import functools
+import hashlib
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
 
 # --- UI moderne
 import customtkinter as ctk
@@ -20,6 +24,27 @@ from PIL import Image, ImageTk
 # --- Selenium avec undetected-chromedriver
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
+import urllib3  # Installed with selenium
+
+# --- Optional fast JSON (falls back to the stdlib json module)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps_bytes(obj):
+    """Serialize obj to indented UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _json_loads(data):
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 def _resolve_app_dir():
     """Directory that contains bundled resources/assets."""
@@ -72,7 +97,9 @@ def _migrate_portable_data(resource_dir, data_dir):
         if has_existing:
             continue
         try:
-            shutil.copytree(src, dst, dirs_exist_ok=True)
+            # copyfile skips the per-file copystat of the default copy2; the Chrome
+            # profile holds hundreds of small files and never reads their timestamps
+            shutil.copytree(src, dst, dirs_exist_ok=True, copy_function=shutil.copyfile)
         except Exception:
             pass
 
@@ -83,16 +110,25 @@ _migrate_portable_data(APP_DIR, DATA_DIR)
 COOKIES_DIR = os.path.join(DATA_DIR, "cookies")
 CONFIG_FILE = os.path.join(DATA_DIR, "config.json")
 CHROME_DATA_DIR = os.path.join(DATA_DIR, "chrome_data")
+# Separate profile for the hidden kick.com API browser: it stays open while streams
+# start, and Chrome refuses a second instance on a profile that is in use
+CHROME_API_DATA_DIR = os.path.join(DATA_DIR, "chrome_api_data")
+THUMB_CACHE_DIR = os.path.join(DATA_DIR, "cache", "thumbs")
 
 os.makedirs(COOKIES_DIR, exist_ok=True)
 os.makedirs(CHROME_DATA_DIR, exist_ok=True)
+os.makedirs(THUMB_CACHE_DIR, exist_ok=True)
 
 # Global debug config reference (set when App initializes)
 _DEBUG_CONFIG = None
 
+def _debug_enabled():
+    """True when debug mode is on; check it before formatting messages inside loops"""
+    return bool(_DEBUG_CONFIG and _DEBUG_CONFIG.debug)
+
 def debug_print(*args, **kwargs):
     """Print debug messages only if debug mode is enabled"""
-    if _DEBUG_CONFIG and _DEBUG_CONFIG.debug:
+    if _debug_enabled():
         print(*args, **kwargs)
 
 # ===============================
@@ -131,6 +167,7 @@ _BUILTIN_TRANSLATIONS_JSON = r'''
     "prompt_minutes_msg": "Minutes à regarder (0 = infini) :",
     "status_link_added": "Lien ajouté",
     "status_link_removed": "Lien supprimé",
+    "status_finished_removed": "{count} élément(s) terminé(s) supprimé(s)",
     "offline_wait_retry": "Offline: {url} - en attente d'un prochain essai",
     "error": "Erreur",
     "invalid_url": "URL invalide.",
@@ -216,6 +253,7 @@ _BUILTIN_TRANSLATIONS_JSON = r'''
     "prompt_minutes_msg": "Minutes to watch (0 = infinite):",
     "status_link_added": "Link added",
     "status_link_removed": "Link removed",
+    "status_finished_removed": "Removed {count} finished item(s)",
     "offline_wait_retry": "Offline: {url} - waiting for next retry",
     "error": "Error",
     "invalid_url": "Invalid URL.",
@@ -274,7 +312,7 @@ _BUILTIN_TRANSLATIONS_JSON = r'''
   }
 }
 '''
-BUILTIN_TRANSLATIONS = json.loads(_BUILTIN_TRANSLATIONS_JSON)
+BUILTIN_TRANSLATIONS = _json_loads(_BUILTIN_TRANSLATIONS_JSON)
 
 
 def _load_external_translations():
@@ -287,18 +325,24 @@ def _load_external_translations():
     # Workspace/data directory (allows portable overrides)
     candidate_roots.append(os.path.join(DATA_DIR, "locales"))
 
-    for locales_dir in candidate_roots:
+    # When not frozen these roots often coincide; scan each directory once, at its
+    # last position so later roots keep overriding earlier ones
+    last_pos = {os.path.normcase(os.path.abspath(d)): i for i, d in enumerate(candidate_roots)}
+    for i, locales_dir in enumerate(candidate_roots):
+        if last_pos[os.path.normcase(os.path.abspath(locales_dir))] != i:
+            continue
         try:
             for entry in os.scandir(locales_dir):
                 if not entry.is_dir():
                     continue
                 lang = entry.name
                 path = os.path.join(entry.path, "messages.json")
-                if not os.path.isfile(path):
-                    continue
                 try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        data[lang] = json.load(f)
+                    # Opening directly saves a separate stat() per language
+                    with open(path, "rb") as f:
+                        data[lang] = _json_loads(f.read())
+                except OSError:
+                    continue  # No messages.json in this folder
                 except Exception:
                     # Ignore malformed translation files so the app can still start
                     pass
@@ -310,7 +354,7 @@ def _load_external_translations():
 def _merge_fallback(external, builtin):
     result = {}
     languages = set(builtin.keys()) | set(external.keys())
-    for lang in sorted(languages):
+    for lang in languages:
         merged = dict(builtin.get(lang, {}))
         merged.update(external.get(lang, {}))
         result[lang] = merged
@@ -321,23 +365,266 @@ def _merge_fallback(external, builtin):
 TRANSLATIONS = _merge_fallback(_load_external_translations(), BUILTIN_TRANSLATIONS)
 
 
+# (lang, key) -> text, so a lookup in a known language is a single dict probe
+_FLAT_TRANSLATIONS = {
+    (lang, key): text for lang, table in TRANSLATIONS.items() for key, text in table.items()
+}
+
+
 def translate(lang: str, key: str) -> str:
-    return TRANSLATIONS.get(lang or "fr", TRANSLATIONS.get("fr", {})).get(key, key)
+    text = _FLAT_TRANSLATIONS.get((lang or "fr", key))
+    if text is not None:
+        return text
+    if lang in TRANSLATIONS:
+        return key  # Known language without this key
+    # Unknown language: fall back to French
+    return TRANSLATIONS.get("fr", {}).get(key, key)
 
 
 # ===============================
 # Utilities / Data
 # ===============================
+# The same few hundred channel URLs are parsed over and over
+@functools.lru_cache(maxsize=512)
 def domain_from_url(url):
     p = urlparse(url)
     return p.netloc
 
 
+# One keep-alive pool for images and Kick API calls instead of a new TCP/TLS connection per request.
+# maxsize covers every thread that can hit one host at once: the probe (8), warm-up (4)
+# and image (8) pools, plus a few stale-thumbnail refreshes
+_HTTP = urllib3.PoolManager(maxsize=24, retries=urllib3.Retry(total=2, backoff_factor=0.2))
+
+
+# A single attempt that still follows redirects. total is left unset on purpose:
+# with total=0 the first redirect would already exhaust the budget.
+_LIVE_PROBE_RETRY = urllib3.Retry(total=None, connect=0, read=0, status=0, other=0, redirect=2)
+
+
+def _http_get(url, headers=None, timeout=5, retries=None):
+    """GET url through the shared pool and return the body; raises on HTTP errors.
+    retries overrides the pool's retry policy (False: a single attempt)."""
+    resp = _HTTP.request("GET", url, headers=headers, timeout=timeout, retries=retries)
+    if resp.status >= 400:
+        raise urllib3.exceptions.HTTPError(f"HTTP {resp.status} for {url}")
+    return resp.data
+
+
+# Downloaded images are kept on disk; entries older than the TTL are served
+# once more and refreshed in the background (stale-while-revalidate)
+_THUMB_TTL = 7 * 24 * 3600
+_THUMB_CACHE_MAX_BYTES = 200 * 1024 * 1024
+_thumb_refreshing = set()
+_thumb_lock = threading.Lock()
+
+
+def _thumb_cache_path(url, ext="img"):
+    key = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(THUMB_CACHE_DIR, f"{key}.{ext}")
+
+
+def _thumb_tile_path(url, size):
+    return _thumb_cache_path(f"{url}#{size[0]}x{size[1]}", "rgba")
+
+
+def _store_thumb(path, data):
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _refresh_thumb(url, path, headers, timeout):
+    try:
+        _store_thumb(path, _http_get(url, headers=headers, timeout=timeout))
+    except Exception:
+        pass  # Keep serving the stale copy
+    finally:
+        with _thumb_lock:
+            _thumb_refreshing.discard(path)
+
+
+def _cached_image_bytes(url, headers=None, timeout=5):
+    """Raw image bytes for url, from the disk cache when possible"""
+    path = _thumb_cache_path(url)
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+            mtime = os.fstat(f.fileno()).st_mtime
+        if time.time() - mtime > _THUMB_TTL:
+            with _thumb_lock:
+                start = path not in _thumb_refreshing
+                _thumb_refreshing.add(path)
+            if start:
+                threading.Thread(
+                    target=_refresh_thumb, args=(url, path, headers, timeout), daemon=True
+                ).start()
+        return data
+    except OSError:
+        pass
+    data = _http_get(url, headers=headers, timeout=timeout)
+    _store_thumb(path, data)
+    return data
+
+
+def _load_thumb_tile(url, size):
+    """Already resized RGBA pixels for url, or None when missing or older than the source image.
+    Stale sources return None too, so _cached_image_bytes gets to refresh them.
+    """
+    try:
+        with open(_thumb_tile_path(url, size), "rb") as f:
+            raw = f.read()
+            tile_mtime = os.fstat(f.fileno()).st_mtime
+        source_mtime = os.path.getmtime(_thumb_cache_path(url))
+    except OSError:
+        return None
+    if len(raw) != size[0] * size[1] * 4 or tile_mtime < source_mtime:
+        return None
+    if time.time() - source_mtime > _THUMB_TTL:
+        return None
+    return Image.frombytes("RGBA", size, raw)
+
+
+# Kick's CDN rejects requests without a browser-like UA/Referer
+_KICK_CDN_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Referer": "https://kick.com/",
+}
+
+
+# Campaign card status badges: progress status -> (text, fg_color)
+_BADGE_GREEN = ("#10b981", "#059669")
+_BADGE_GRAY = ("#6b7280", "#4b5563")
+_PROGRESS_BADGES = {
+    "in progress": ("IN PROGRESS", ("#f59e0b", "#d97706")),
+    "claimed": ("CLAIMED", _BADGE_GREEN),
+}
+
+
+# Campaign card channel buttons: (fg_color, hover_color) per state
+_CHANNEL_ADD_STYLE = {"fg_color": ("#3b82f6", "#2563eb"), "hover_color": ("#2563eb", "#1d4ed8")}
+_CHANNEL_REMOVE_STYLE = {"fg_color": ("#ef4444", "#dc2626"), "hover_color": ("#dc2626", "#b91c1c")}
+_BULK_ADD_STYLE = {"fg_color": ("#10b981", "#059669"), "hover_color": ("#059669", "#047857")}
+_BULK_REMOVE_STYLE = _CHANNEL_REMOVE_STYLE
+
+
+def _reward_image_url(reward):
+    """Absolute image URL for a drop reward, or "" if it has none"""
+    url = reward.get("image_url", "")
+    if url and not url.startswith("http"):
+        url = f"https://ext.cdn.kick.com/{url}"
+    return url
+
+
+def _campaign_minutes(campaign, default=120):
+    """Watch target for a campaign: its largest reward requirement, or default"""
+    rewards = campaign.get("rewards") or []
+    return max((r.get("required_units", 0) for r in rewards), default=0) or default
+
+
+def _campaign_channel_refs(campaign):
+    """[{url, username}] alternatives stored on a campaign's queue items.
+
+    Built once per fetched campaign and kept on it, so every item added from the
+    same campaign shares one list; it is never mutated afterwards.
+    """
+    refs = campaign.get("_queue_channels")
+    if refs is None:
+        refs = campaign["_queue_channels"] = [
+            {"url": ch.get("url") if isinstance(ch, dict) else ch,
+             "username": ch.get("username", "") if isinstance(ch, dict) else ""}
+            for ch in campaign.get("channels", [])
+        ]
+    return refs
+
+
+def _campaign_category_id(campaign):
+    """Category id a campaign's channels must be streaming, or None"""
+    category = campaign.get("category", {})
+    if isinstance(category, dict):
+        return category.get("id")
+    # Try from progress_data
+    progress_data = campaign.get("progress_data", {})
+    if isinstance(progress_data, dict):
+        progress_category = progress_data.get("category", {})
+        if isinstance(progress_category, dict):
+            return progress_category.get("id")
+    return None
+
+
+def _prune_thumb_cache(max_bytes=_THUMB_CACHE_MAX_BYTES):
+    """Delete least recently written cache entries until the cache fits in max_bytes"""
+    try:
+        entries = []
+        total = 0
+        with os.scandir(THUMB_CACHE_DIR) as it:
+            for entry in it:
+                if entry.is_file():
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+        if total <= max_bytes:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+            if total <= max_bytes:
+                break
+    except OSError:
+        pass
+
+
+# Treeview row tags by (row parity, finished)
+_ROW_TAGS = {
+    (0, 0): ("even",),
+    (1, 0): ("odd",),
+    (0, 1): ("even", "finished"),
+    (1, 1): ("odd", "finished"),
+}
+
+# Time given to the browser to load an alternative channel before (re)starting it
+_ALT_CHANNEL_WAIT_MS = 8000
+
+
+@functools.lru_cache(maxsize=64)
 def cookie_file_for_domain(domain):
     safe = domain.replace(":", "_")
     return os.path.join(COOKIES_DIR, f"{safe}.json")
 
 
+def _item_cookie_target(item):
+    """(domain, cookie file) for item["url"], cached on the item until the URL changes.
+    Kept runtime-only: a persisted absolute path would go stale if DATA_DIR moves.
+    """
+    cached = item.get("_cookie_target")
+    if cached is None or cached[0] != item["url"]:
+        domain = domain_from_url(item["url"])
+        cookie_path = cookie_file_for_domain(domain) if domain else None
+        cached = item["_cookie_target"] = (item["url"], domain, cookie_path)
+    return cached[1], cached[2]
+
+
+def _tried_set(item):
+    """In-memory set mirror of item["tried_channels"] for O(1) membership checks.
+    Config.save() writes it back as a list and never persists the set itself.
+    """
+    tried = item.get("_tried_set")
+    if tried is None:
+        tried = item["_tried_set"] = set(item.get("tried_channels") or [])
+    return tried
+
+
 def kick_is_live_by_api(url: str) -> bool:
     """Returns True if the Kick channel is live (via API).
      In case of network error, returns True to avoid blocking the queue.
@@ -356,15 +643,23 @@ def kick_live_status_by_api(url: str):
         if not username:
             return None
         api_url = f"https://kick.com/api/v2/channels/{username}"
-        req = urllib.request.Request(api_url, headers={"User-Agent": "Mozilla/5.0"})
-        with urllib.request.urlopen(req, timeout=8) as resp:
-            data = json.load(resp)
+        # One attempt with an 8 s total deadline (callers wait at most 10 s for a probe);
+        # redirects are still followed
+        data = _json_loads(
+            _http_get(
+                api_url,
+                headers={"User-Agent": "Mozilla/5.0"},
+                timeout=urllib3.Timeout(total=8),
+                retries=_LIVE_PROBE_RETRY,
+            )
+        )
         livestream = data.get("livestream")
         return bool(livestream and livestream.get("is_live"))
     except Exception:
         return None
 
 
+@functools.lru_cache(maxsize=512)
 def _kick_username_from_url(url: str):
     try:
         p = urlparse(url)
@@ -422,6 +717,42 @@ def is_campaign_expired(campaign):
         return False  # On error, assume not expired
 
 
+def open_kick_api_driver():
+    """Off-screen Chrome with a kick.com session (saved cookies loaded) for API fetches"""
+    driver = make_chrome_driver(
+        headless=False, visible_width=400, visible_height=300,
+        user_data_dir=CHROME_API_DATA_DIR,  # Cookies come from the cookie file
+    )
+    
+    # Position window off-screen
+    try:
+        driver.set_window_position(-2000, -2000)
+    except:
+        pass
+    
+    # Visit kick.com and load cookies
+    print("Establishing session on kick.com...")
+    driver.get("https://kick.com")
+    time.sleep(1)
+    
+    # Load saved cookies
+    cookie_path = cookie_file_for_domain("kick.com")
+    if os.path.exists(cookie_path):
+        print("Loading saved cookies...")
+        with open(cookie_path, "r", encoding="utf-8") as f:
+            cookies = json.load(f)
+        for cookie in cookies:
+            try:
+                if "expiry" in cookie and cookie["expiry"] is None:
+                    del cookie["expiry"]
+                driver.add_cookie(cookie)
+            except:
+                pass
+        driver.refresh()
+        time.sleep(1)
+    return driver
+
+
 def fetch_live_streamers_by_category(category_id, limit=24, driver=None):
     """Fetches live streamers currently streaming a specific game category.
     Uses category_id from the campaign data.
@@ -433,28 +764,7 @@ def fetch_live_streamers_by_category(category_id, limit=24, driver=None):
     should_close_driver = False
     if driver is None:
         try:
-            driver = make_chrome_driver(headless=False, visible_width=400, visible_height=300)
-            try:
-                driver.set_window_position(-2000, -2000)
-            except:
-                pass
-            driver.get("https://kick.com")
-            time.sleep(1)
-            
-            # Load cookies
-            cookie_path = cookie_file_for_domain("kick.com")
-            if os.path.exists(cookie_path):
-                with open(cookie_path, "r", encoding="utf-8") as f:
-                    cookies = json.load(f)
-                for cookie in cookies:
-                    try:
-                        if "expiry" in cookie and cookie["expiry"] is None:
-                            del cookie["expiry"]
-                        driver.add_cookie(cookie)
-                    except:
-                        pass
-                driver.refresh()
-                time.sleep(1)
+            driver = open_kick_api_driver()
             should_close_driver = True
         except Exception as e:
             print(f"Error creating driver for game search: {e}")
@@ -490,7 +800,7 @@ def fetch_live_streamers_by_category(category_id, limit=24, driver=None):
             return []
         
         debug_print("DEBUG: Parsing JSON response...")
-        data = json.loads(page_text)
+        data = _json_loads(page_text)
         debug_print(f"DEBUG: Parsed data keys: {list(data.keys())}")
         
         streamers = []
@@ -509,28 +819,34 @@ def fetch_live_streamers_by_category(category_id, limit=24, driver=None):
             debug_print(f"DEBUG: Unexpected data structure: {type(data_obj)}")
         
         debug_print(f"DEBUG: Processing {min(len(streams), limit)} streams (limit={limit})")
+        debug = _debug_enabled()  # Checked once, not per stream
         
         for idx, stream in enumerate(streams[:limit]):
             try:
-                debug_print(f"DEBUG: Processing stream {idx + 1}/{min(len(streams), limit)}")
+                if debug:
+                    debug_print(f"DEBUG: Processing stream {idx + 1}/{min(len(streams), limit)}")
                 # Extract channel slug/username
                 channel = stream.get("channel", {})
                 if not channel:
-                    debug_print(f"DEBUG: Stream {idx + 1} has no channel data")
+                    if debug:
+                        debug_print(f"DEBUG: Stream {idx + 1} has no channel data")
                     continue
                 
-                debug_print(f"DEBUG: Channel data keys: {list(channel.keys())}")
+                if debug:
+                    debug_print(f"DEBUG: Channel data keys: {list(channel.keys())}")
                 slug = channel.get("slug")
                 if not slug:
                     # Try alternative structure
                     user = channel.get("user", {})
                     slug = user.get("username") or user.get("slug")
-                    debug_print(f"DEBUG: Got slug from user object: {slug}")
+                    if debug:
+                        debug_print(f"DEBUG: Got slug from user object: {slug}")
                 
                 if slug:
                     viewer_count = stream.get("viewer_count", 0)
                     title = stream.get("session_title", "")
-                    debug_print(f"DEBUG: Adding streamer: {slug} ({viewer_count} viewers) - {title[:50]}")
+                    if debug:
+                        debug_print(f"DEBUG: Adding streamer: {slug} ({viewer_count} viewers) - {title[:50]}")
                     streamers.append({
                         "url": f"https://kick.com/{slug}",
                         "username": slug,
@@ -538,9 +854,11 @@ def fetch_live_streamers_by_category(category_id, limit=24, driver=None):
                         "viewer_count": viewer_count
                     })
                 else:
-                    debug_print(f"DEBUG: Could not extract slug from stream {idx + 1}")
+                    if debug:
+                        debug_print(f"DEBUG: Could not extract slug from stream {idx + 1}")
             except Exception as e:
-                debug_print(f"DEBUG: Error parsing stream {idx + 1}: {e}")
+                if debug:
+                    debug_print(f"DEBUG: Error parsing stream {idx + 1}: {e}")
                 import traceback
                 traceback.print_exc()
                 continue
@@ -574,7 +892,8 @@ def fetch_drop_campaigns():
         # (headless is detected by Kick, so we use a real window but hidden)
         # Note: StreamWorkers use their own user-configured parameters
         driver = make_chrome_driver(
-            headless=False, visible_width=400, visible_height=300
+            headless=False, visible_width=400, visible_height=300,
+            user_data_dir=CHROME_API_DATA_DIR,
         )
 
         # Position the window off-screen to make it invisible
@@ -637,7 +956,7 @@ def fetch_drop_campaigns():
             return {"campaigns": [], "driver": None}
 
         # Parse le JSON
-        response = json.loads(page_text)
+        response = _json_loads(page_text)
         print(f"Successfully fetched campaign data!")
         print(f"We have found {len(response.get('data', []))} campaigns")
 
@@ -714,37 +1033,7 @@ def fetch_drops_progress(driver=None):
         if not use_existing_driver:
             print("Fetching drops progress...")
             
-            # Use the same approach as fetch_drop_campaigns
-            driver = make_chrome_driver(
-                headless=False, visible_width=400, visible_height=300
-            )
-            
-            # Position window off-screen
-            try:
-                driver.set_window_position(-2000, -2000)
-            except:
-                pass
-            
-            # Visit kick.com and load cookies
-            print("Establishing session on kick.com...")
-            driver.get("https://kick.com")
-            time.sleep(1)
-            
-            # Load saved cookies
-            cookie_path = cookie_file_for_domain("kick.com")
-            if os.path.exists(cookie_path):
-                print("Loading saved cookies...")
-                with open(cookie_path, "r", encoding="utf-8") as f:
-                    cookies = json.load(f)
-                for cookie in cookies:
-                    try:
-                        if "expiry" in cookie and cookie["expiry"] is None:
-                            del cookie["expiry"]
-                        driver.add_cookie(cookie)
-                    except:
-                        pass
-                driver.refresh()
-                time.sleep(1)
+            driver = open_kick_api_driver()
         else:
             print("Fetching progress from API (reusing existing session)...")
         
@@ -818,46 +1107,20 @@ def fetch_drops_progress(driver=None):
         return {"progress": [], "driver": None}
 
 
-def fetch_drops_campaigns_and_progress():
-    """Fetches both campaigns and progress data using a single Chrome driver instance"""
-    driver = None
+def fetch_drops_campaigns_and_progress(driver=None):
+    """Fetches both campaigns and progress data using a single Chrome driver instance.
+    If driver is provided, reuses it; the returned driver is only set when one was created here.
+    """
+    use_existing_driver = driver is not None
     try:
         campaigns_api_url = "https://web.kick.com/api/v1/drops/campaigns"
         progress_api_url = "https://web.kick.com/api/v1/drops/progress"
         
         print("Fetching drops campaigns and progress...")
         
-        # Create one driver for both requests
-        driver = make_chrome_driver(
-            headless=False, visible_width=400, visible_height=300
-        )
-        
-        # Position window off-screen
-        try:
-            driver.set_window_position(-2000, -2000)
-        except:
-            pass
-        
-        # Visit kick.com and load cookies
-        print("Establishing session on kick.com...")
-        driver.get("https://kick.com")
-        time.sleep(1)
-        
-        # Load saved cookies
-        cookie_path = cookie_file_for_domain("kick.com")
-        if os.path.exists(cookie_path):
-            print("Loading saved cookies...")
-            with open(cookie_path, "r", encoding="utf-8") as f:
-                cookies = json.load(f)
-            for cookie in cookies:
-                try:
-                    if "expiry" in cookie and cookie["expiry"] is None:
-                        del cookie["expiry"]
-                    driver.add_cookie(cookie)
-                except:
-                    pass
-            driver.refresh()
-            time.sleep(1)
+        # One driver for both requests, reused when the caller keeps one around
+        if not use_existing_driver:
+            driver = open_kick_api_driver()
         
         # Get session_token cookie for Authorization header
         session_token = None
@@ -909,6 +1172,11 @@ def fetch_drops_campaigns_and_progress():
         # Check if blocked
         if "blocked by security policy" in campaigns_text.lower():
             print(f"Campaigns request blocked! Response: {campaigns_text}")
+            if not use_existing_driver:
+                try:
+                    driver.quit()
+                except:
+                    pass
             return {"campaigns": [], "progress": [], "driver": None}
         
         if "blocked by security policy" in progress_text.lower():
@@ -963,13 +1231,13 @@ def fetch_drops_campaigns_and_progress():
         progress_data = progress_response.get("data", [])
         print(f"Successfully fetched {len(progress_data)} campaigns with progress")
         
-        return {"campaigns": campaigns, "progress": progress_data, "driver": driver}
+        return {"campaigns": campaigns, "progress": progress_data, "driver": driver if not use_existing_driver else None}
         
     except Exception as e:
         print(f"Error fetching drops data: {e}")
         import traceback
         traceback.print_exc()
-        if driver:
+        if driver and not use_existing_driver:
             try:
                 driver.quit()
             except:
@@ -1061,6 +1329,7 @@ def make_chrome_driver(
     visible_height=800,
     driver_path=None,
     extension_path=None,
+    user_data_dir=CHROME_DATA_DIR,
 ):
     opts = uc.ChromeOptions()  # Use undetected-chromedriver options
 
@@ -1082,7 +1351,6 @@ def make_chrome_driver(
     opts.add_argument("--log-level=3")
     opts.add_argument("--silent")
 
-    user_data_dir = CHROME_DATA_DIR
     os.makedirs(user_data_dir, exist_ok=True)
     opts.add_argument(f"--user-data-dir={user_data_dir}")
 
@@ -1449,6 +1717,13 @@ class StreamWorker(threading.Thread):
 # ===============================
 # Config
 # ===============================
+def _log_save_error(fut):
+    """Done-callback for background config writes, whose errors would otherwise vanish"""
+    e = fut.exception()
+    if e is not None:
+        print(f"Error saving config: {e}")
+
+
 class Config:
     def __init__(self):
         self.items = []
@@ -1462,12 +1737,25 @@ class Config:
         self.language = "fr"  # default language code
         self.auto_start = False  # Auto-start queue on launch
         self.debug = False  # Debug messages disabled by default
+        self._url_index = None  # url -> first index in items, built lazily by index_of_url
+        self._campaign_index = None  # campaign_id -> [items], built lazily by items_for_campaign
+        self._uid_index = None  # uid -> index in items, built lazily by index_of_uid
+        self._disk_payload = None  # Bytes last read from or written to CONFIG_FILE
+        # Snapshots are numbered so a slow background write can't overwrite a newer one
+        self._write_lock = threading.Lock()
+        self._snapshot_seq = 0
+        self._written_seq = 0
         self.load()
 
     def load(self):
+        self._url_index = None
+        self._campaign_index = None
+        self._uid_index = None
         if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(CONFIG_FILE, "rb") as f:
+                raw = f.read()
+            data = _json_loads(raw)
+            self._disk_payload = raw
             self.items = data.get("items", [])
             # Migrate old items format to new format with campaign info
             for item in self.items:
@@ -1484,6 +1772,9 @@ class Config:
                 # Add tried_channels tracking to prevent switching loops
                 if "tried_channels" not in item:
                     item["tried_channels"] = []
+                # Stable id used as worker key and Treeview iid (row indices shift on removal)
+                if not item.get("uid"):
+                    item["uid"] = uuid.uuid4().hex
             self.chromedriver_path = data.get("chromedriver_path")
             self.extension_path = data.get("extension_path")
             self.mute = data.get("mute", True)
@@ -1498,8 +1789,19 @@ class Config:
             self.items = []
 
     def save(self):
+        self.write_snapshot(*self.snapshot())
+
+    def snapshot(self):
+        """(seq, JSON bytes) of the current state; call on the thread that owns items"""
+        items = []
+        for item in self.items:
+            tried = item.get("_tried_set")
+            if tried is not None:
+                item["tried_channels"] = list(tried)
+            # Underscore-prefixed keys are runtime-only caches (not JSON-serializable)
+            items.append({k: v for k, v in item.items() if not k.startswith("_")})
         data = {
-            "items": self.items,
+            "items": items,
             "chromedriver_path": self.chromedriver_path,
             "extension_path": self.extension_path,
             "mute": self.mute,
@@ -1511,12 +1813,36 @@ class Config:
             "auto_start": self.auto_start,
             "debug": self.debug,
         }
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        self._snapshot_seq += 1
+        return self._snapshot_seq, _json_dumps_bytes(data)
+
+    def write_snapshot(self, seq, payload):
+        """Write a snapshot() result to disk; safe to call from a background thread"""
+        with self._write_lock:
+            if seq <= self._written_seq:
+                return  # A newer snapshot already reached the disk
+            if payload == self._disk_payload:
+                self._written_seq = seq
+                return  # Nothing changed since the last write; skip the write and fsync
+            # Write to a temp file then swap it in so a crash never truncates the config
+            tmp_path = CONFIG_FILE + ".tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, CONFIG_FILE)
+            # Only record the write once it has landed, so a failed one is retried
+            self._written_seq = seq
+            self._disk_payload = payload
 
-    def add(self, url, minutes, campaign_id=None, campaign_channels=None, required_category_id=None, is_global_drop=False):
+    def add(self, url, minutes, campaign_id=None, campaign_channels=None, required_category_id=None, is_global_drop=False, save=True):
         """Add item with optional campaign grouping"""
         item = {
+            "uid": uuid.uuid4().hex,
             "url": url,
             "minutes": minutes,
             "campaign_id": campaign_id,
@@ -1526,11 +1852,103 @@ class Config:
             "cumulative_time": 0,  # Track cumulative time across all streamers in campaign
         }
         self.items.append(item)
-        self.save()
-
-    def remove(self, idx):
+        if self._url_index is not None:
+            self._url_index.setdefault(url, len(self.items) - 1)
+        if self._campaign_index is not None and campaign_id:
+            self._campaign_index.setdefault(campaign_id, []).append(item)
+        if self._uid_index is not None:
+            self._uid_index[item["uid"]] = len(self.items) - 1
+        if save:
+            self.save()
+
+    def remove(self, idx, save=True):
         del self.items[idx]
-        self.save()
+        self._url_index = None  # Later indices shifted
+        self._campaign_index = None
+        self._uid_index = None
+        if save:
+            self.save()
+
+    def index_of_url(self, url):
+        """Index of the first item with this url, or None"""
+        if self._url_index is None:
+            index = {}
+            for i, item in enumerate(self.items):
+                index.setdefault(item["url"], i)
+            self._url_index = index
+        return self._url_index.get(url)
+
+    def index_of_uid(self, uid):
+        """Index of the item with this uid, or None if it was removed"""
+        if self._uid_index is None:
+            self._uid_index = {item["uid"]: i for i, item in enumerate(self.items)}
+        return self._uid_index.get(uid)
+
+    def items_for_campaign(self, campaign_id):
+        """Items belonging to campaign_id, in list order (the item dicts themselves)"""
+        if self._campaign_index is None:
+            index = {}
+            for item in self.items:
+                cid = item.get("campaign_id")
+                if cid:
+                    index.setdefault(cid, []).append(item)
+            self._campaign_index = index
+        return self._campaign_index.get(campaign_id, ())
+
+    def invalidate_indexes(self):
+        """Call after changing items without add/remove (reassigning the list, editing a url)"""
+        self._url_index = None
+        self._campaign_index = None
+        self._uid_index = None
+
+
+# TRANSLATIONS is fixed after startup, so the language picker data is cached
+@functools.lru_cache(maxsize=1)
+def _available_language_codes():
+    codes = list(TRANSLATIONS.keys())
+    ordered = []
+    for preferred in ("fr", "en"):
+        if preferred in codes:
+            ordered.append(preferred)
+    for code in sorted(c for c in codes if c not in ordered):
+        ordered.append(code)
+    return tuple(ordered)
+
+
+def _language_label_for(current_lang, lang_code):
+    label_key = f"language_{lang_code}"
+    label = translate(current_lang, label_key)
+    if label == label_key:
+        label = translate(lang_code, label_key)
+    if label == label_key:
+        label = lang_code
+    return label
+
+
+@functools.lru_cache(maxsize=1)
+def _ready_variants():
+    """The "ready" status text in every language, for spotting an untouched status bar"""
+    return frozenset(translate(lang, "status_ready") for lang in TRANSLATIONS)
+
+
+@functools.lru_cache(maxsize=16)
+def _compute_language_choices(current_lang):
+    """(choice labels, (label, code) pairs) for the language picker in current_lang"""
+    codes = _available_language_codes()
+    labels = tuple(_language_label_for(current_lang, code) for code in codes)
+    return labels, tuple(zip(labels, codes))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_logo(size):
+    """Load assets/logo.png once per size and share the CTkImage"""
+    with Image.open(os.path.join(APP_DIR, "assets", "logo.png")) as img:
+        img.draft("RGBA", (size[0] * 2, size[1] * 2))  # Lets JPEG decoders scale while decoding
+        img.load()  # Decode now so the file handle can be closed
+        img = img.copy()
+    # Keep 2x the display size for HiDPI scaling, drop the rest of the pixels
+    img.thumbnail((size[0] * 2, size[1] * 2), Image.Resampling.LANCZOS)
+    return ctk.CTkImage(light_image=img, dark_image=img, size=size)
 
 
 # ===============================
@@ -1547,14 +1965,55 @@ class App(ctk.CTk):
         # Set global debug config reference
         global _DEBUG_CONFIG
         _DEBUG_CONFIG = self.config_data
-        self.workers = {}
+        self.workers = {}  # item uid -> StreamWorker
         self._interactive_driver = None  # Chrome pour capture de cookies
         self.queue_running = False
         self.queue_current_idx = None
+        self._start_token = 0  # Bumped on each _start_index call to drop stale probe results
+        self._starting = False  # A start is being probed or waiting on a channel switch
+        self._retry_round = None  # In-flight offline retry probe round
+        # Debounced config writer: bursts of edits collapse into one disk write
+        self._config_dirty = False
+        self._config_flush_pending = False
+        self._refresh_pending = False  # refresh_list already queued for idle time
+        # iid -> [{column: text}, tags or None] staged for _flush_tree_updates
+        self._tree_pending = {}
+        self._tree_flush_scheduled = False
+        # uid -> latest (seconds, live) tick from a worker, applied by _flush_worker_ticks
+        self._worker_ticks = {}
+        self._worker_ticks_scheduled = False
+        self._worker_ticks_lock = threading.Lock()
+        # campaign_id -> sum of its items' cumulative_time, read by global-drop workers
+        self._campaign_cumulative = defaultdict(int)
+        # Domains whose cookie file is known to exist (skips the stat on each start)
+        self._cookie_present_domains = set()
+        self._rebuild_campaign_cumulative()
+        # Shared pool for concurrent live-status probes
+        self._probe_pool = ThreadPoolExecutor(max_workers=8)
+        # Queue warm-up probes get their own workers so they never delay a start's probes
+        self._warmup_pool = ThreadPoolExecutor(max_workers=4)
+        self._live_cache = {}  # url -> (monotonic time, live) for _is_live_cached
+        self._image_cache = {}  # (url, size) -> CTkImage for game and reward images, lives as long as the app
+        self._fonts = {}  # font options -> shared CTkFont, see _font
+        self._tooltip = None  # Shared hover tooltip window, see _show_tooltip
+        # Drops window status texts waiting for the next flush (label -> text)
+        self._status_pending = {}
+        self._status_flush_scheduled = False
+        self._status_lock = threading.Lock()
+        # Separate pool for image downloads so they never queue behind live probes
+        self._image_pool = ThreadPoolExecutor(max_workers=8)
+        # Drops scraping and streamer search run one at a time on this thread,
+        # sharing one hidden kick.com browser (see _api_driver)
+        self._browser_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kdm-browser")
+        # Config writes (write + fsync) run here; the Tk thread only serializes
+        self._save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kdm-save")
+        self._browser_driver = None
+        self._browser_cookie_mtime = None
 
         # Helper traduction
         def _t(key: str, **kwargs):
-            return translate(self.config_data.language, key).format(**kwargs)
+            text = translate(self.config_data.language, key)
+            return text.format(**kwargs) if kwargs else text
 
         self.t = _t
 
@@ -1573,6 +2032,10 @@ class App(ctk.CTk):
         # (uses a high empty row to serve as expandable space)
         self.sidebar.grid_rowconfigure(99, weight=1)
 
+        # (widget, translation key) pairs relabelled in place by _retranslate
+        self._i18n_widgets = []
+        self._settings_win = None  # Built on first open, then hidden/shown
+        self._last_applied_theme = None  # Appearance mode the Treeview style was built for
         self._build_sidebar()
 
         # Contenu principal
@@ -1592,10 +2055,14 @@ class App(ctk.CTk):
             row=1, column=0, columnspan=2, sticky="ew", padx=10, pady=(0, 10)
         )
 
-        self.refresh_list()
+        # Populate the list and start the monitor once the first frame is drawn
+        self.refresh_list()  # Deferred to idle time
         
         # Start offline retry monitor
-        self._start_offline_retry_monitor()
+        self.after_idle(self._start_offline_retry_monitor)
+
+        # Keep the image cache bounded
+        threading.Thread(target=_prune_thumb_cache, daemon=True).start()
         
         # Auto-start queue if enabled
         if self.config_data.auto_start and self.config_data.items:
@@ -1608,33 +2075,44 @@ class App(ctk.CTk):
         except Exception:
             pass
 
+    def _mark_dirty(self):
+        """Flag the config as modified and schedule a single deferred save"""
+        self._config_dirty = True
+        if not self._config_flush_pending:
+            self._config_flush_pending = True
+            self.after(500, self._flush_config)
+
+    def _flush_config(self):
+        self._config_flush_pending = False
+        if not self._config_dirty:
+            return
+        self._config_dirty = False
+        self._save_in_background()
+
+    def _save_in_background(self):
+        """Snapshot the config on the Tk thread and write it on the save thread"""
+        snapshot = self.config_data.snapshot()
+        try:
+            fut = self._save_pool.submit(self.config_data.write_snapshot, *snapshot)
+        except RuntimeError:
+            self.config_data.write_snapshot(*snapshot)  # Pool already shut down (closing)
+            return
+        fut.add_done_callback(_log_save_error)
+
     def _available_languages(self):
-        codes = list(TRANSLATIONS.keys())
-        ordered = []
-        for preferred in ("fr", "en"):
-            if preferred in codes:
-                ordered.append(preferred)
-        for code in sorted(c for c in codes if c not in ordered):
-            ordered.append(code)
-        return ordered
+        return list(_available_language_codes())
 
     def _language_label(self, lang_code):
-        label_key = f"language_{lang_code}"
-        label = translate(self.config_data.language, label_key)
-        if label == label_key:
-            label = translate(lang_code, label_key)
-        if label == label_key:
-            label = lang_code
-        return label
+        return _language_label_for(self.config_data.language, lang_code)
 
     def _get_language_choices(self):
-        codes = self._available_languages()
+        codes = _available_language_codes()
         if self.config_data.language not in codes and codes:
             self.config_data.language = codes[0]
-            self.config_data.save()
-        labels = {code: self._language_label(code) for code in codes}
-        self.lang_display_to_code = {label: code for code, label in labels.items()}
-        return [labels[code] for code in codes]
+            self._mark_dirty()
+        choices, display_to_code = _compute_language_choices(self.config_data.language)
+        self.lang_display_to_code = dict(display_to_code)
+        return list(choices)
 
     # ----------- UI construction -----------
     def _build_sidebar(self):
@@ -1644,11 +2122,7 @@ class App(ctk.CTk):
 
         # Logo (assets/logo.png) + title
         try:
-            logo_path = os.path.join(APP_DIR, "assets", "logo.png")
-            img = Image.open(logo_path)
-            self._logo_img = ctk.CTkImage(
-                light_image=img, dark_image=img, size=(24, 24)
-            )
+            self._logo_img = _load_logo((24, 24))
             logo_lbl = ctk.CTkLabel(header, image=self._logo_img, text="")
             logo_lbl.grid(row=0, column=0, padx=(4, 6), pady=4, sticky="w")
         except Exception:
@@ -1664,16 +2138,23 @@ class App(ctk.CTk):
             self.sidebar, text=self.t("btn_add"), command=self.add_link, width=180
         )
         btn_add.grid(row=1, column=0, padx=14, pady=6, sticky="w")
+        self._i18n_widgets.append((btn_add, "btn_add"))
 
         btn_remove = ctk.CTkButton(
             self.sidebar,
             text=self.t("btn_remove"),
             width=180,
         )
-        # Bind to the underlying tkinter widget to detect Ctrl key
-        # We'll handle both normal and Ctrl+click in the bound function
+        # Bind to the underlying tkinter widget to detect Ctrl/Shift
+        # Modifier mask -> action for on_remove_button_click
+        self._remove_dispatch = {
+            0: self.remove_selected,
+            0x4: self.clear_all_items,
+            0x1: self.remove_finished_only,
+        }
         btn_remove.bind("<Button-1>", self.on_remove_button_click)
         btn_remove.grid(row=2, column=0, padx=14, pady=6, sticky="w")
+        self._i18n_widgets.append((btn_remove, "btn_remove"))
 
         btn_start_queue = ctk.CTkButton(
             self.sidebar,
@@ -1682,6 +2163,7 @@ class App(ctk.CTk):
             width=180,
         )
         btn_start_queue.grid(row=3, column=0, padx=14, pady=(6, 2), sticky="w")
+        self._i18n_widgets.append((btn_start_queue, "btn_start_queue"))
 
         btn_stop = ctk.CTkButton(
             self.sidebar,
@@ -1692,6 +2174,7 @@ class App(ctk.CTk):
             width=180,
         )
         btn_stop.grid(row=4, column=0, padx=14, pady=6, sticky="w")
+        self._i18n_widgets.append((btn_stop, "btn_stop_sel"))
 
         btn_signin = ctk.CTkButton(
             self.sidebar,
@@ -1700,6 +2183,7 @@ class App(ctk.CTk):
             width=180,
         )
         btn_signin.grid(row=5, column=0, padx=14, pady=6, sticky="w")
+        self._i18n_widgets.append((btn_signin, "btn_signin"))
 
         btn_drops = ctk.CTkButton(
             self.sidebar,
@@ -1710,6 +2194,7 @@ class App(ctk.CTk):
             width=180,
         )
         btn_drops.grid(row=6, column=0, padx=14, pady=6, sticky="w")
+        self._i18n_widgets.append((btn_drops, "btn_drops"))
 
         # Settings button
         btn_settings = ctk.CTkButton(
@@ -1748,6 +2233,7 @@ class App(ctk.CTk):
             font=ctk.CTkFont(size=16, weight="bold"),
         )
         title.grid(row=0, column=0, sticky="w", padx=10, pady=10)
+        self._i18n_widgets.append((title, "title_streams"))
 
         # Tableau (ttk.Treeview) dans un CTkFrame
         table_frame = ctk.CTkFrame(self.content, corner_radius=12)
@@ -1755,53 +2241,9 @@ class App(ctk.CTk):
         table_frame.grid_columnconfigure(0, weight=1)
         table_frame.grid_rowconfigure(0, weight=1)
 
-        style = ttk.Style()
-        # Automatic light/dark theme
-        if ctk.get_appearance_mode() == "Dark":
-            style.theme_use("clam")
-            style.configure(
-                "Treeview",
-                background="#1f2125",
-                fieldbackground="#1f2125",
-                foreground="#e6e6e6",
-                rowheight=26,
-                bordercolor="#2b2d31",
-            )
-            style.configure(
-                "Treeview.Heading",
-                background="#2b2d31",
-                foreground="#e6e6e6",
-                font=("Segoe UI", 10, "bold"),
-            )
-            sel_bg = "#3b82f6"
-            style.map(
-                "Treeview",
-                background=[("selected", sel_bg)],
-                foreground=[("selected", "white")],
-            )
-        else:
-            style.theme_use("clam")
-            style.configure(
-                "Treeview",
-                background="#ffffff",
-                fieldbackground="#ffffff",
-                foreground="#111111",
-                rowheight=26,
-                bordercolor="#e9ecef",
-            )
-            style.configure(
-                "Treeview.Heading",
-                background="#eef2f7",
-                foreground="#111111",
-                font=("Segoe UI", 10, "bold"),
-            )
-            sel_bg = "#2d8cff"
-            style.map(
-                "Treeview",
-                background=[("selected", sel_bg)],
-                foreground=[("selected", "white")],
-            )
-
+        # Last (url, minutes, tags) written per row by refresh_list
+        self._row_state = {}
+        self._row_order = []  # iids in Treeview order
         self.tree = ttk.Treeview(
             table_frame,
             columns=("url", "minutes", "elapsed"),
@@ -1823,46 +2265,123 @@ class App(ctk.CTk):
         # Bind double-click to edit minutes
         self.tree.bind("<Double-Button-1>", self.on_tree_double_click)
 
+        self._apply_tree_style()
+
+    def _apply_tree_style(self):
+        """(Re)apply Treeview colours for the current appearance mode, in place"""
+        mode = ctk.get_appearance_mode()
+        if self._last_applied_theme == mode:
+            return
+        self._last_applied_theme = mode
+
+        # Automatic light/dark theme
+        if mode == "Dark":
+            bg, fg, border, head_bg, sel_bg = "#1f2125", "#e6e6e6", "#2b2d31", "#2b2d31", "#3b82f6"
+        else:
+            bg, fg, border, head_bg, sel_bg = "#ffffff", "#111111", "#e9ecef", "#eef2f7", "#2d8cff"
+        # One theme_settings call hands Tk the whole Treeview style at once
+        style = ttk.Style()
+        style.theme_settings(
+            "clam",
+            {
+                "Treeview": {
+                    "configure": {
+                        "background": bg,
+                        "fieldbackground": bg,
+                        "foreground": fg,
+                        "rowheight": 26,
+                        "bordercolor": border,
+                    },
+                    "map": {
+                        "background": [("selected", sel_bg)],
+                        "foreground": [("selected", "white")],
+                    },
+                },
+                "Treeview.Heading": {
+                    "configure": {
+                        "background": head_bg,
+                        "foreground": fg,
+                        "font": ("Segoe UI", 10, "bold"),
+                    },
+                },
+            },
+        )
+        style.theme_use("clam")
+
         # Colored rows via tags
         try:
             self.tree.tag_configure(
                 "odd",
                 background="#0f0f11"
-                if ctk.get_appearance_mode() == "Dark"
+                if mode == "Dark"
                 else "#f7f7f7",
             )
             self.tree.tag_configure(
                 "even",
                 background="#1f2125"
-                if ctk.get_appearance_mode() == "Dark"
+                if mode == "Dark"
                 else "#ffffff",
             )
             self.tree.tag_configure(
                 "redo",
                 background="#3a3a00"
-                if ctk.get_appearance_mode() == "Dark"
+                if mode == "Dark"
                 else "#fff3cd",
             )
             self.tree.tag_configure(
                 "paused",
                 background="#3a2e2a"
-                if ctk.get_appearance_mode() == "Dark"
+                if mode == "Dark"
                 else "#fde2e2",
             )
             self.tree.tag_configure(
                 "finished",
                 background="#22352a"
-                if ctk.get_appearance_mode() == "Dark"
+                if mode == "Dark"
                 else "#e6f7e8",
             )
         except Exception:
             pass
 
+    def _retranslate(self):
+        """Relabel the main window in place after a language change"""
+        for widget, key in self._i18n_widgets:
+            try:
+                widget.configure(text=self.t(key))
+            except Exception:
+                pass
+        try:
+            self.tree.heading("minutes", text=self.t("col_minutes"))
+            self.tree.heading("elapsed", text=self.t("col_elapsed"))
+        except Exception:
+            pass
+        self.theme_var.set(
+            self.t("theme_dark") if self.config_data.dark_mode else self.t("theme_light")
+        )
+        language_choices = self._get_language_choices()  # Refresh label -> code mapping
+        self.lang_var.set(self._language_label(self.config_data.language))
+        # Option menus in the (possibly hidden) settings window
+        if self._settings_win is not None and self._settings_win.winfo_exists():
+            try:
+                self._theme_menu.configure(values=[self.t("theme_dark"), self.t("theme_light")])
+                self._lang_menu.configure(values=language_choices)
+            except Exception:
+                pass
+
     # ----------- Theme -----------
     def show_settings_window(self):
         """Open settings window with all toggles and dropdowns"""
+        # Reuse the window built on first open
+        win = self._settings_win
+        if win is not None and win.winfo_exists():
+            win.deiconify()
+            win.lift()
+            win.grab_set()
+            return
+
         # Create settings window
         settings_window = ctk.CTkToplevel(self)
+        self._settings_win = settings_window
         settings_window.title("Settings")
         settings_window.geometry("450x650")
         settings_window.resizable(False, False)
@@ -1913,6 +2432,7 @@ class App(ctk.CTk):
             variable=self.mute_var,
         )
         sw_mute.pack(anchor="w", padx=15, pady=5)
+        self._i18n_widgets.append((sw_mute, "switch_mute"))
         
         # Hide player toggle
         sw_hide = ctk.CTkSwitch(
@@ -1922,6 +2442,7 @@ class App(ctk.CTk):
             variable=self.hide_player_var,
         )
         sw_hide.pack(anchor="w", padx=15, pady=5)
+        self._i18n_widgets.append((sw_hide, "switch_hide"))
         
         # Mini player toggle
         sw_mini = ctk.CTkSwitch(
@@ -1931,6 +2452,7 @@ class App(ctk.CTk):
             variable=self.mini_player_var,
         )
         sw_mini.pack(anchor="w", padx=15, pady=5)
+        self._i18n_widgets.append((sw_mini, "switch_mini"))
         
         # Force 160p toggle
         sw_force_160p = ctk.CTkSwitch(
@@ -1940,6 +2462,7 @@ class App(ctk.CTk):
             variable=self.force_160p_var,
         )
         sw_force_160p.pack(anchor="w", padx=15, pady=(5, 15))
+        self._i18n_widgets.append((sw_force_160p, "switch_force_160p"))
         
         # Queue Settings Section
         queue_section = ctk.CTkFrame(scrollable_frame)
@@ -1975,7 +2498,8 @@ class App(ctk.CTk):
         # Theme dropdown
         theme_label = ctk.CTkLabel(appearance_section, text=self.t("label_theme"))
         theme_label.pack(anchor="w", padx=15, pady=(5, 5))
-        theme_menu = ctk.CTkOptionMenu(
+        self._i18n_widgets.append((theme_label, "label_theme"))
+        theme_menu = self._theme_menu = ctk.CTkOptionMenu(
             appearance_section,
             values=[self.t("theme_dark"), self.t("theme_light")],
             command=self.change_theme,
@@ -1988,7 +2512,8 @@ class App(ctk.CTk):
         language_choices = self._get_language_choices()
         lang_label = ctk.CTkLabel(appearance_section, text=self.t("label_language"))
         lang_label.pack(anchor="w", padx=15, pady=(5, 5))
-        lang_menu = ctk.CTkOptionMenu(
+        self._i18n_widgets.append((lang_label, "label_language"))
+        lang_menu = self._lang_menu = ctk.CTkOptionMenu(
             appearance_section,
             values=language_choices,
             command=self.change_language,
@@ -2013,9 +2538,9 @@ class App(ctk.CTk):
             self.choose_chromedriver()
             settings_window.lift()
             settings_window.focus_force()
-            # Refresh the window to update labels
-            settings_window.destroy()
-            self.show_settings_window()
+            self._chromedriver_label.configure(
+                text=self._current_path_text(self.config_data.chromedriver_path)
+            )
         
         btn_chromedriver = ctk.CTkButton(
             browser_section,
@@ -2024,11 +2549,12 @@ class App(ctk.CTk):
             width=350,
         )
         btn_chromedriver.pack(anchor="w", padx=15, pady=5)
+        self._i18n_widgets.append((btn_chromedriver, "btn_chromedriver"))
         
         # Show current chromedriver path if set
-        chromedriver_label = ctk.CTkLabel(
+        chromedriver_label = self._chromedriver_label = ctk.CTkLabel(
             browser_section,
-            text=f"Current: {os.path.basename(self.config_data.chromedriver_path) if self.config_data.chromedriver_path else 'Not set'}",
+            text=self._current_path_text(self.config_data.chromedriver_path),
             font=ctk.CTkFont(size=11),
             text_color=("gray50", "gray50")
         )
@@ -2039,9 +2565,9 @@ class App(ctk.CTk):
             self.choose_extension()
             settings_window.lift()
             settings_window.focus_force()
-            # Refresh the window to update labels
-            settings_window.destroy()
-            self.show_settings_window()
+            self._extension_label.configure(
+                text=self._current_path_text(self.config_data.extension_path)
+            )
         
         btn_extension = ctk.CTkButton(
             browser_section,
@@ -2050,11 +2576,12 @@ class App(ctk.CTk):
             width=350,
         )
         btn_extension.pack(anchor="w", padx=15, pady=5)
+        self._i18n_widgets.append((btn_extension, "btn_extension"))
         
         # Show current extension path if set
-        extension_label = ctk.CTkLabel(
+        extension_label = self._extension_label = ctk.CTkLabel(
             browser_section,
-            text=f"Current: {os.path.basename(self.config_data.extension_path) if self.config_data.extension_path else 'Not set'}",
+            text=self._current_path_text(self.config_data.extension_path),
             font=ctk.CTkFont(size=11),
             text_color=("gray50", "gray50")
         )
@@ -2064,22 +2591,35 @@ class App(ctk.CTk):
         close_btn = ctk.CTkButton(
             settings_window,
             text="Close",
-            command=settings_window.destroy,
+            command=self._hide_settings_window,
             width=200,
         )
         close_btn.pack(pady=15)
+        # Closing only hides the window so the next open is instant
+        settings_window.protocol("WM_DELETE_WINDOW", self._hide_settings_window)
+
+    def _hide_settings_window(self):
+        win = self._settings_win
+        if win is None:
+            return
+        try:
+            win.grab_release()
+            win.withdraw()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _current_path_text(path):
+        return f"Current: {os.path.basename(path) if path else 'Not set'}"
 
     def change_theme(self, choice):
         # Accepts FR/EN
         dark = choice in (self.t("theme_dark"), "Sombre", "Dark")
         self.config_data.dark_mode = dark
-        self.config_data.save()
+        self._mark_dirty()
         ctk.set_appearance_mode("Dark" if dark else "Light")
-        # Rebuild content (to recalculate Treeview styles)
-        for w in self.content.winfo_children():
-            w.destroy()
-        self._build_content()
-        self.refresh_list()
+        # CTk widgets follow the mode themselves; only the ttk Treeview needs restyling
+        self._apply_tree_style()
 
     # ----------- Language -----------
     def change_language(self, choice):
@@ -2102,27 +2642,14 @@ class App(ctk.CTk):
             return  # No change needed
 
         self.config_data.language = new_lang
-        self.config_data.save()
-
-        # Rebuild sidebar & content to refresh text
-        try:
-            for w in self.sidebar.winfo_children():
-                w.destroy()
-            self._build_sidebar()
-        except Exception:
-            pass
+        self._mark_dirty()
 
-        try:
-            for w in self.content.winfo_children():
-                w.destroy()
-            self._build_content()
-        except Exception:
-            pass
+        # Relabel existing widgets instead of rebuilding them
+        self._retranslate()
 
         # Update status bar if it's at the initial text
         try:
-            ready_variants = [translate(lang, "status_ready") for lang in TRANSLATIONS]
-            if self.status_var.get() in ready_variants:
+            if self.status_var.get() in _ready_variants():
                 self.status_var.set(self.t("status_ready"))
         except Exception:
             pass
@@ -2142,12 +2669,12 @@ class App(ctk.CTk):
         
         # Check if clicked on minutes column (column #2)
         if column == "#2":
-            idx = int(row_id)
-            if idx >= len(self.config_data.items):
+            idx = self._index_of_uid(row_id)
+            if idx is None:
                 return
             
             # Check if this stream is currently running
-            if idx in self.workers:
+            if row_id in self.workers:
                 messagebox.showwarning(
                     self.t("warning"),
                     self.t("cannot_edit_active_stream")
@@ -2165,25 +2692,114 @@ class App(ctk.CTk):
             
             if new_minutes is not None:
                 self.config_data.items[idx]["minutes"] = new_minutes
-                self.config_data.save()
+                self._mark_dirty()
                 self.refresh_list()
                 self.status_var.set(f"Updated target to {new_minutes} minutes")
     
     def refresh_list(self):
-        for r in self.tree.get_children():
-            self.tree.delete(r)
+        """Schedule a Treeview reconcile; calls in the same event-loop pass share one redraw"""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_pending = False
+        self._refresh_list_now()
+
+    def _refresh_list_now(self):
+        """Reconcile the Treeview with config items, touching only rows that changed.
+        The elapsed column is pushed per row by on_worker_update, not rendered here.
+        """
+        self._flush_tree_updates()  # Apply staged cell/tag writes before reconciling
+        row_state = self._row_state
+        # Drop rows for items that no longer exist
+        live_uids = {item["uid"] for item in self.config_data.items}
+        for iid in [k for k in row_state if k not in live_uids]:
+            self.tree.delete(iid)
+            del row_state[iid]
+        # Tree order of the surviving rows, kept in step with insert/move below
+        order = [iid for iid in self._row_order if iid in row_state]
+
         for i, item in enumerate(self.config_data.items):
-            elapsed = self.workers[i].elapsed_seconds if i in self.workers else 0
-            tags = ["odd" if i % 2 else "even"]
-            if item.get("finished"):
-                tags.append("finished")
-            self.tree.insert(
-                "",
-                "end",
-                iid=str(i),
-                values=(item["url"], item["minutes"], f"{elapsed}s"),
-                tags=tuple(tags),
-            )
+            iid = item["uid"]
+            tags = _ROW_TAGS[(i & 1, 1 if item.get("finished") else 0)]
+            state = (item["url"], item["minutes"], tags)
+            prev = row_state.get(iid)
+            if prev is None:
+                worker = self.workers.get(iid)
+                elapsed = worker.elapsed_seconds if worker else 0
+                self.tree.insert(
+                    "",
+                    i,
+                    iid=iid,
+                    values=(state[0], state[1], f"{elapsed}s"),
+                    tags=state[2],
+                )
+                order.insert(i, iid)
+            else:
+                if order[i] != iid:
+                    # Reposition the existing row rather than delete + reinsert
+                    self.tree.move(iid, "", i)
+                    order.remove(iid)
+                    order.insert(i, iid)
+                if prev != state:
+                    self.tree.set(iid, "url", state[0])
+                    self.tree.set(iid, "minutes", state[1])
+                    self.tree.item(iid, tags=state[2])
+            row_state[iid] = state
+        self._row_order = order
+
+    def _refresh_row(self, item):
+        """Push one item's url/minutes to its row without reconciling the whole list"""
+        iid = item["uid"]
+        prev = self._row_state.get(iid)
+        if prev is None:
+            self.refresh_list()  # Row not shown yet; the reconcile inserts it
+            return
+        state = (item["url"], item["minutes"], prev[2])
+        if state != prev:
+            self._queue_row_update(iid, url=state[0], minutes=state[1])
+            self._row_state[iid] = state
+
+    def _queue_row_update(self, iid, tags=None, **columns):
+        """Stage cell/tag changes for a row; _flush_tree_updates applies them in one burst"""
+        pending = self._tree_pending.get(iid)
+        if pending is None:
+            pending = self._tree_pending[iid] = [{}, None]
+        pending[0].update(columns)
+        if tags is not None:
+            pending[1] = tuple(tags)
+        if not self._tree_flush_scheduled:
+            self._tree_flush_scheduled = True
+            self.after(100, self._flush_tree_updates)
+
+    def _row_tags(self, iid):
+        """Row tags including any staged but not yet flushed change"""
+        pending = self._tree_pending.get(iid)
+        if pending is not None and pending[1] is not None:
+            return pending[1]
+        return self.tree.item(iid, "tags") or ()
+
+    def _row_value(self, iid, column):
+        """Cell text including any staged but not yet flushed change"""
+        pending = self._tree_pending.get(iid)
+        if pending is not None and column in pending[0]:
+            return pending[0][column]
+        return self.tree.set(iid, column)
+
+    def _flush_tree_updates(self):
+        self._tree_flush_scheduled = False
+        if not self._tree_pending:
+            return
+        pending, self._tree_pending = self._tree_pending, {}
+        for iid, (columns, tags) in pending.items():
+            if not self.tree.exists(iid):
+                continue  # Row removed since the update was staged
+            for column, text in columns.items():
+                self.tree.set(iid, column, text)
+            if tags is not None:
+                self.tree.item(iid, tags=tags)
 
     def add_link(self):
         url = simpledialog.askstring(
@@ -2196,7 +2812,8 @@ class App(ctk.CTk):
         minutes = simpledialog.askinteger(
             self.t("prompt_minutes_title"), self.t("prompt_minutes_msg"), minvalue=0
         )
-        self.config_data.add(url, minutes or 0)
+        self.config_data.add(url, minutes or 0, save=False)
+        self._mark_dirty()
         self.refresh_list()
         self.status_var.set(self.t("status_link_added"))
         # Auto-start if enabled and queue not running
@@ -2204,16 +2821,41 @@ class App(ctk.CTk):
             self.after(500, self._auto_start_queue)
 
     def on_remove_button_click(self, event):
-        """Handle remove button click - check for Ctrl key"""
-        # Check if Ctrl key is pressed (state & 0x4 is Control modifier)
-        ctrl_pressed = (event.state & 0x4) != 0
-        
-        if ctrl_pressed:
-            # Ctrl is pressed - show clear all dialog
-            self.after(0, self.clear_all_items)
-        else:
-            # Normal remove action
-            self.after(0, self.remove_selected)
+        """Handle remove button click: plain, Ctrl (clear all) or Shift (clear finished)"""
+        # Modifier bits: 0x1 is Shift, 0x4 is Control
+        handler = self._remove_dispatch.get(event.state & 0x5, self.remove_selected)
+        # Deferred so the button release is processed before any dialog opens
+        self.after(0, handler)
+
+    def remove_finished_only(self):
+        """Remove every finished item from the list"""
+        finished = [item for item in self.config_data.items if item.get("finished")]
+        if not finished:
+            return
+        for item in finished:
+            worker = self.workers.pop(item["uid"], None)
+            if worker:
+                worker.stop()
+        items = self.config_data.items
+        current = self.queue_current_idx
+        current_item = items[current] if current is not None and 0 <= current < len(items) else None
+        self.config_data.items = [item for item in items if not item.get("finished")]
+        self.config_data.invalidate_indexes()
+        self._rebuild_campaign_cumulative()
+        self._mark_dirty()
+        self.refresh_list()
+        self.status_var.set(self.t("status_finished_removed", count=len(finished)))
+        if current_item is not None:
+            # Rows above the queue's item are gone; follow it to its new row
+            idx = self._index_of_uid(current_item["uid"])
+            if idx is not None:
+                self.queue_current_idx = idx
+            else:
+                # The queue's own item was finished and removed: go on with the next one
+                idx = sum(1 for item in items[:current] if not item.get("finished"))
+                self.queue_current_idx = idx
+                if self.queue_running and not self.workers and not self._starting:
+                    self._run_queue_from(idx)
     
     def clear_all_items(self):
         """Clear all items from the list after confirmation"""
@@ -2229,7 +2871,7 @@ class App(ctk.CTk):
         
         if result:
             # Stop all running workers
-            for idx, worker in list(self.workers.items()):
+            for worker in list(self.workers.values()):
                 try:
                     worker.stop()
                 except Exception:
@@ -2238,7 +2880,9 @@ class App(ctk.CTk):
             
             # Clear all items
             self.config_data.items = []
-            self.config_data.save()
+            self.config_data.invalidate_indexes()
+            self._rebuild_campaign_cumulative()
+            self._mark_dirty()
             
             # Refresh UI
             self.refresh_list()
@@ -2249,17 +2893,16 @@ class App(ctk.CTk):
         sel = self.tree.selection()
         if not sel:
             return
-        idx = int(sel[0])
-        self.config_data.remove(idx)
-        if idx in self.workers:
-            self.workers[idx].stop()
-            del self.workers[idx]
-        # Re-index workers (because indices have shifted)
-        self.workers = {
-            new_i: self.workers[old_i]
-            for new_i, old_i in enumerate(sorted(self.workers.keys()))
-            if old_i < len(self.config_data.items)
-        }
+        uid = sel[0]
+        idx = self._index_of_uid(uid)
+        if idx is None:
+            return
+        self.config_data.remove(idx, save=False)
+        self._rebuild_campaign_cumulative()
+        self._mark_dirty()
+        worker = self.workers.pop(uid, None)
+        if worker:
+            worker.stop()
         self.refresh_list()
         self.status_var.set(self.t("status_link_removed"))
 
@@ -2267,180 +2910,224 @@ class App(ctk.CTk):
         sel = self.tree.selection()
         if not sel:
             return
-        idx = int(sel[0])
-        self._start_index(idx)
+        idx = self._index_of_uid(sel[0])
+        if idx is not None:
+            self._start_index(idx)
+
+    def _index_of_uid(self, uid):
+        """Current row index of the item with this uid, or None if it was removed"""
+        return self.config_data.index_of_uid(uid)
 
     def _start_index(self, idx):
-        """Start a stream, ensuring only one runs at a time (Kick limitation)"""
+        """Start a stream, ensuring only one runs at a time (Kick limitation).
+        Live checks run on a background thread; results are applied via after().
+        """
+        # A newer start request supersedes any that is still being probed
+        self._start_token += 1
+        token = self._start_token
+        self._starting = True
         # Stop any currently running stream (Kick only allows 1 at a time)
         if len(self.workers) > 0:
             # Find and stop the currently running worker
-            for running_idx, worker in list(self.workers.items()):
+            for running_uid, worker in list(self.workers.items()):
                 worker.stop()
-                del self.workers[running_idx]
+                del self.workers[running_uid]
                 # Mark as not finished so it can be retried
-                if running_idx < len(self.config_data.items):
+                running_idx = self._index_of_uid(running_uid)
+                if running_idx is not None:
                     self.config_data.items[running_idx]["finished"] = False
-            time.sleep(2)  # Brief pause to let browser close
-        
-        item = self.config_data.items[idx]
-        
-        # Try alternative channels from same campaign if current is offline
-        if not kick_is_live_by_api(item["url"]):
-            campaign_channels = item.get("campaign_channels", [])
-            if campaign_channels:
-                tried_channels = item.get("tried_channels", [])
-                current_url = item["url"]
-                
-                # Add current URL to tried list if not already there
-                if current_url not in tried_channels:
-                    tried_channels.append(current_url)
-                
-                # Get all channel URLs
-                all_channel_urls = []
-                for ch in campaign_channels:
-                    ch_url = ch.get("url") if isinstance(ch, dict) else ch
-                    if ch_url:
-                        all_channel_urls.append(ch_url)
-                if current_url not in all_channel_urls:
-                    all_channel_urls.append(current_url)
-                
-                # Reset if all channels tried
-                if len(tried_channels) >= len(all_channel_urls):
-                    tried_channels.clear()
-                    debug_print(f"DEBUG: Reset tried_channels in _start_index for campaign {item.get('campaign_id')}")
-                
-                # Try to find a live alternative channel that hasn't been tried
-                switched_in_start = False
-                for alt_channel in campaign_channels:
-                    alt_url = alt_channel.get("url") if isinstance(alt_channel, dict) else alt_channel
-                    if alt_url and alt_url != item["url"] and alt_url not in tried_channels:
-                        if kick_is_live_by_api(alt_url):
-                            # Switch to this alternative channel
-                            self.config_data.items[idx]["url"] = alt_url
-                            tried_channels.append(alt_url)
-                            item["tried_channels"] = tried_channels
-                            self.config_data.save()
-                            self.refresh_list()
-                            item = self.config_data.items[idx]  # Update item reference
-                            debug_print(f"DEBUG: Switched to alternative in _start_index: {alt_url} (tried: {len(tried_channels)}/{len(all_channel_urls)})")
-                            self.status_var.set(f"Switched to {alt_url.split('/')[-1]} - waiting for page to load...")
-                            switched_in_start = True
-                            # Wait 8 seconds to allow browser to fully load before checking if stream is live
-                            # Use after() to avoid blocking UI thread
-                            self.after(8000, lambda i=idx: self._start_index_after_switch(i))
-                            return
-                
-                # If we switched, we already scheduled a callback, so return early
-                if switched_in_start:
-                    return
-        
-        # Check again after potential channel switch
-        if not kick_is_live_by_api(item["url"]):
-            try:
-                values = list(self.tree.item(str(idx), "values"))
-                values[2] = self.t("retry")
-                self.tree.item(str(idx), values=values, tags=("redo",))
-            except Exception:
-                pass
-            self.status_var.set(self.t("offline_wait_retry", url=item["url"]))
+            # Brief pause to let browser close, without blocking the event loop;
+            # bind the uid since rows may be removed or reordered meanwhile
+            uid = self.config_data.items[idx]["uid"]
+            self.after(2000, functools.partial(self._dispatch_start_uid, uid, token, idx))
             return
+        self._dispatch_start(idx, token)
+
+    def _resolve_start_uid(self, uid, queue_idx):
+        """Row index for a start scheduled by uid; abandons the start if the item is gone"""
+        idx = self._index_of_uid(uid)
+        if idx is None:
+            self._starting = False
+            self._on_start_failed(queue_idx, removed=True)
+            return None
+        if idx != queue_idx and self.queue_current_idx == queue_idx:
+            self.queue_current_idx = idx  # Rows above it were removed
+        return idx
 
-        domain = domain_from_url(item["url"])
-        if not domain:
-            messagebox.showerror(self.t("error"), self.t("invalid_url"))
+    def _dispatch_start_uid(self, uid, token, queue_idx):
+        if token != self._start_token:
+            return
+        idx = self._resolve_start_uid(uid, queue_idx)
+        if idx is not None:
+            self._dispatch_start(idx, token)
+
+    def _dispatch_start(self, idx, token):
+        """Snapshot what the background probe needs and hand it off to a thread"""
+        if token != self._start_token:
+            return  # Superseded; the newer start owns _starting
+        if idx < 0 or idx >= len(self.config_data.items):
+            self._starting = False
+            self._on_start_failed(idx, removed=True)
+            return
+        item = self.config_data.items[idx]
+        current_url = item["url"]
+
+        # Work out untried alternatives here so the probe thread never touches config items
+        campaign_channels = item.get("campaign_channels", [])
+        tried_channels = None
+        candidates = []
+        if campaign_channels:
+            tried_channels = set(_tried_set(item))
+            tried_channels.add(current_url)
+
+            # All channel URLs, including the current one
+            all_channel_urls = {
+                ch.get("url") if isinstance(ch, dict) else ch for ch in campaign_channels
+            }
+            all_channel_urls.discard(None)
+            all_channel_urls.discard("")
+            all_channel_urls.add(current_url)
+
+            # Reset if all channels tried
+            if len(tried_channels) >= len(all_channel_urls):
+                tried_channels.clear()
+                debug_print(f"DEBUG: Reset tried_channels in _start_index for campaign {item.get('campaign_id')}")
+
+            for alt_channel in campaign_channels:
+                alt_url = alt_channel.get("url") if isinstance(alt_channel, dict) else alt_channel
+                if alt_url and alt_url != current_url and alt_url not in tried_channels:
+                    candidates.append(alt_url)
+
+        threading.Thread(
+            target=self._start_index_bg,
+            args=(idx, token, current_url, candidates, tried_channels),
+            daemon=True,
+        ).start()
+
+    def _start_index_bg(self, idx, token, url, candidates, tried_channels):
+        """Background half of _start_index: network probes only, no Tk calls"""
+        live = self._is_live_cached(url)
+        alt_url = None
+        if not live and candidates:
+            # Probe every untried alternative concurrently and take the first live one
+            alt_url = self._first_live_channel(candidates)
+        self._post_to_ui(self._apply_start_result, idx, token, url, live, alt_url, tried_channels)
+
+    def _apply_start_result(self, idx, token, url, live, alt_url, tried_channels):
+        """UI-thread half of _start_index: act on the probe results"""
+        if token != self._start_token:
+            return
+        self._starting = False
+        if idx >= len(self.config_data.items):
+            self._on_start_failed(idx, removed=True)
+            return
+        item = self.config_data.items[idx]
+        if item["url"] != url:
+            # Item was edited while probing
+            self._on_start_failed(idx)
             return
 
-        cookie_path = cookie_file_for_domain(domain)
-        if not os.path.exists(cookie_path):
-            # Auto-import cookies silently (no popup for automation)
-            try:
-                if not CookieManager.import_from_browser(domain):
-                    # Only show popup if auto-import fails and we're not in auto mode
-                    if not self.config_data.auto_start:
-                        if messagebox.askyesno(
-                            self.t("cookies_missing_title"), self.t("cookies_missing_msg")
-                        ):
-                            self.obtain_cookies_interactively(item["url"], domain)
-                    else:
-                        # In auto mode, skip items without cookies
-                        self.status_var.set(f"Skipping {item['url']} - no cookies")
-                        return
-            except Exception:
-                if not self.config_data.auto_start:
-                    if messagebox.askyesno(
-                        self.t("cookies_missing_title"), self.t("cookies_missing_msg")
-                    ):
-                        self.obtain_cookies_interactively(item["url"], domain)
-                else:
-                    return
-
-        stop_event = threading.Event()
-        
-        # Setup cumulative time callback for global drops
-        is_global_drop = item.get("is_global_drop", False)
-        cumulative_time_callback = None
-        if is_global_drop:
-            campaign_id = item.get("campaign_id")
-            def get_cumulative_time():
-                """Get current cumulative time for this campaign"""
-                if not campaign_id:
-                    return 0
-                total = 0
-                for other_item in self.config_data.items:
-                    if other_item.get("campaign_id") == campaign_id:
-                        total += other_item.get("cumulative_time", 0)
-                return total
-            cumulative_time_callback = get_cumulative_time
-        
-        worker = StreamWorker(
-            item["url"],
-            item["minutes"],
-            on_update=lambda s, live: self.on_worker_update(idx, s, live),
-            on_finish=lambda e, c: self.on_worker_finish(idx, e, c),
-            stop_event=stop_event,
-            driver_path=self.config_data.chromedriver_path,
-            extension_path=self.config_data.extension_path,
-            hide_player=bool(self.hide_player_var.get()),
-            mute=bool(self.mute_var.get()),
-            mini_player=bool(self.mini_player_var.get()),
-            force_160p=bool(self.config_data.force_160p),
-            required_category_id=item.get("required_category_id"),
-            cumulative_time_callback=cumulative_time_callback,
-        )
-        self.workers[idx] = worker
-        worker.start()
-        self.tree.selection_set(str(idx))
-        self.status_var.set(self.t("status_playing", url=item["url"]))
+        if not live:
+            if tried_channels is not None:
+                item["_tried_set"] = tried_channels
+            if alt_url:
+                # Switch to this alternative channel
+                item["url"] = alt_url
+                self.config_data.invalidate_indexes()
+                tried_channels.add(alt_url)
+                self._mark_dirty()
+                self._refresh_row(item)
+                debug_print(f"DEBUG: Switched to alternative in _start_index: {alt_url} (tried: {len(tried_channels)})")
+                self.status_var.set(f"Switched to {alt_url.split('/')[-1]} - waiting for page to load...")
+                # Wait 8 seconds to allow browser to fully load before checking if stream is live
+                # Use after() to avoid blocking UI thread
+                self._starting = True
+                self.after(
+                    _ALT_CHANNEL_WAIT_MS,
+                    functools.partial(self._begin_stream_uid, item["uid"], token, idx),
+                )
+                return
+
+            self._mark_start_offline(idx)
+            return
+
+        self._begin_stream(idx)
+
+    def _on_start_failed(self, idx, removed=False):
+        """Move the queue past an item that could not be started.
+        removed means the item is gone, so the next one has already shifted into idx.
+        """
+        if self.queue_running and self.queue_current_idx == idx and not self.workers:
+            self._run_queue_from(idx if removed else idx + 1)
+            self._wake_offline_retry()
+
+    def _is_live_cached(self, url, max_age=20):
+        """kick_is_live_by_api with a short per-URL cache; safe to call from any thread"""
+        now = time.monotonic()
+        hit = self._live_cache.get(url)
+        if hit is not None and now - hit[0] < max_age:
+            return hit[1]
+        live = kick_is_live_by_api(url)
+        self._live_cache[url] = (time.monotonic(), live)
+        return live
+
+    def _first_live_channel(self, urls, timeout=10):
+        """Probe channels concurrently; return the first URL reported live, or None"""
+        if not urls:
+            return None
+        futures = {self._probe_pool.submit(self._is_live_cached, url): url for url in urls}
+        try:
+            for fut in as_completed(futures, timeout=timeout):
+                try:
+                    if fut.result():
+                        return futures[fut]
+                except Exception:
+                    pass
+        except FutureTimeoutError:
+            pass
+        finally:
+            # Drop probes that have not started yet
+            for fut in futures:
+                fut.cancel()
+        return None
 
-    def _start_index_after_switch(self, idx):
-        """Continue _start_index after a delay when switching channels"""
+    def _begin_stream(self, idx, check_live=False, token=None):
+        """Check cookies and launch the StreamWorker for an item (Tk thread).
+        check_live re-probes the channel first (on a background thread), used after
+        a channel switch; token drops the call if a newer start has been requested.
+        """
+        if token is not None and token != self._start_token:
+            return
+        self._starting = False
         if idx < 0 or idx >= len(self.config_data.items):
+            self._on_start_failed(idx, removed=True)
             return
-        
         item = self.config_data.items[idx]
-        
+
         # Check again after potential channel switch (after delay)
-        if not kick_is_live_by_api(item["url"]):
-            try:
-                values = list(self.tree.item(str(idx), "values"))
-                values[2] = self.t("retry")
-                self.tree.item(str(idx), values=values, tags=("redo",))
-            except Exception:
-                pass
-            self.status_var.set(self.t("offline_wait_retry", url=item["url"]))
+        if check_live:
+            self._starting = True
+            threading.Thread(
+                target=self._check_live_then_continue,
+                args=(idx, self._start_token, item["url"]),
+                daemon=True,
+            ).start()
             return
 
-        domain = domain_from_url(item["url"])
+        domain, cookie_path = _item_cookie_target(item)
         if not domain:
             messagebox.showerror(self.t("error"), self.t("invalid_url"))
+            self._on_start_failed(idx)
             return
 
-        cookie_path = cookie_file_for_domain(domain)
-        if not os.path.exists(cookie_path):
+        if domain not in self._cookie_present_domains and os.path.exists(cookie_path):
+            self._cookie_present_domains.add(domain)
+        if domain not in self._cookie_present_domains:
             # Auto-import cookies silently (no popup for automation)
             try:
-                if not CookieManager.import_from_browser(domain):
+                if CookieManager.import_from_browser(domain):
+                    self._cookie_present_domains.add(domain)
+                else:
                     # Only show popup if auto-import fails and we're not in auto mode
                     if not self.config_data.auto_start:
                         if messagebox.askyesno(
@@ -2450,6 +3137,7 @@ class App(ctk.CTk):
                     else:
                         # In auto mode, skip items without cookies
                         self.status_var.set(f"Skipping {item['url']} - no cookies")
+                        self._on_start_failed(idx)
                         return
             except Exception:
                 if not self.config_data.auto_start:
@@ -2458,31 +3146,22 @@ class App(ctk.CTk):
                     ):
                         self.obtain_cookies_interactively(item["url"], domain)
                 else:
+                    self._on_start_failed(idx)
                     return
 
+        uid = item["uid"]
         stop_event = threading.Event()
         
         # Setup cumulative time callback for global drops
-        is_global_drop = item.get("is_global_drop", False)
         cumulative_time_callback = None
-        if is_global_drop:
-            campaign_id = item.get("campaign_id")
-            def get_cumulative_time():
-                """Get current cumulative time for this campaign"""
-                if not campaign_id:
-                    return 0
-                total = 0
-                for other_item in self.config_data.items:
-                    if other_item.get("campaign_id") == campaign_id:
-                        total += other_item.get("cumulative_time", 0)
-                return total
-            cumulative_time_callback = get_cumulative_time
+        if item.get("is_global_drop", False):
+            cumulative_time_callback = self._make_cumulative_callback(item.get("campaign_id"))
         
         worker = StreamWorker(
             item["url"],
             item["minutes"],
-            on_update=lambda s, live: self.on_worker_update(idx, s, live),
-            on_finish=lambda e, c: self.on_worker_finish(idx, e, c),
+            on_update=lambda s, live, uid=uid: self.on_worker_update(uid, s, live),
+            on_finish=lambda e, c, uid=uid: self.on_worker_finish(uid, worker, e, c),
             stop_event=stop_event,
             driver_path=self.config_data.chromedriver_path,
             extension_path=self.config_data.extension_path,
@@ -2493,14 +3172,79 @@ class App(ctk.CTk):
             required_category_id=item.get("required_category_id"),
             cumulative_time_callback=cumulative_time_callback,
         )
-        self.workers[idx] = worker
+        self.workers[uid] = worker
         worker.start()
-        self.tree.selection_set(str(idx))
-        self.status_var.set(self.t("status_playing", url=item["url"]))
+        self.tree.selection_set(uid)
+        if self.queue_running and self.queue_current_idx == idx:
+            self.status_var.set(self.t("queue_running_status", url=item["url"]))
+        else:
+            self.status_var.set(self.t("status_playing", url=item["url"]))
+
+    def _begin_stream_uid(self, uid, token, queue_idx):
+        """Delayed _begin_stream(check_live=True) after a channel switch, resolved by uid"""
+        if token != self._start_token:
+            return
+        idx = self._resolve_start_uid(uid, queue_idx)
+        if idx is not None:
+            self._begin_stream(idx, check_live=True, token=token)
+
+    def _start_uid(self, uid, queue_idx, token):
+        """Delayed _start_index, resolved by uid when the timer fires"""
+        if token != self._start_token:
+            return
+        idx = self._resolve_start_uid(uid, queue_idx)
+        if idx is not None:
+            self._start_index(idx)
+
+    def _check_live_then_continue(self, idx, token, url):
+        live = kick_is_live_by_api(url)
+        self._post_to_ui(self._begin_stream_continue, idx, token, url, live)
+
+    def _begin_stream_continue(self, idx, token, url, live):
+        if token != self._start_token:
+            return
+        self._starting = False
+        if idx >= len(self.config_data.items):
+            self._on_start_failed(idx, removed=True)
+            return
+        if self.config_data.items[idx]["url"] != url:
+            # Item was edited while probing
+            self._on_start_failed(idx)
+            return
+        if live:
+            self._begin_stream(idx)
+        else:
+            self._mark_start_offline(idx)
+
+    def _mark_start_offline(self, idx):
+        """Flag an item that could not start because its channel is offline"""
+        item = self.config_data.items[idx]
+        self._queue_row_update(item["uid"], tags=("redo",), elapsed=self.t("retry"))
+        self.status_var.set(self.t("offline_wait_retry", url=item["url"]))
+        self._on_start_failed(idx)
+
+    def _make_cumulative_callback(self, campaign_id):
+        """Callable returning the campaign's cumulative watch time, for StreamWorker"""
+        # .get rather than [] so the worker thread never inserts into the defaultdict
+        return functools.partial(self._campaign_cumulative.get, campaign_id, 0)
+
+    def _rebuild_campaign_cumulative(self):
+        """Recompute the per-campaign totals after items were removed (updated in place)"""
+        totals = self._campaign_cumulative
+        totals.clear()
+        for item in self.config_data.items:
+            campaign_id = item.get("campaign_id")
+            if campaign_id:
+                totals[campaign_id] += item.get("cumulative_time", 0)
 
     def start_all_in_order(self):
         self.queue_running = True
         self.queue_current_idx = None
+        # Warm the live-status cache for the next few items in parallel; later ones
+        # would outlive the cache before their turn comes
+        pending = [item["url"] for item in self.config_data.items if not item.get("finished")]
+        for url in pending[:8]:
+            self._warmup_pool.submit(self._is_live_cached, url)
         self._run_queue_from(0)
 
     def _run_queue_from(self, start_idx: int):
@@ -2514,14 +3258,11 @@ class App(ctk.CTk):
             item = self.config_data.items[i]
             if item.get("finished"):
                 continue
-            self.tree.selection_set(str(i))
-            before = set(self.workers.keys())
+            self.tree.selection_set(item["uid"])
+            # Starting is asynchronous; _on_start_failed resumes from i + 1 if this item can't play
+            self.queue_current_idx = i
             self._start_index(i)
-            after = set(self.workers.keys())
-            if i in after:
-                self.queue_current_idx = i
-                self.status_var.set(self.t("queue_running_status", url=item["url"]))
-                return  # Only one stream at a time
+            return  # Only one stream at a time
         self.queue_running = False
         self.queue_current_idx = None
         self.status_var.set(self.t("queue_finished_status"))
@@ -2530,16 +3271,16 @@ class App(ctk.CTk):
         sel = self.tree.selection()
         if not sel:
             return
-        idx = int(sel[0])
-        if idx in self.workers:
-            self.workers[idx].stop()
-            del self.workers[idx]
+        uid = sel[0]
+        worker = self.workers.get(uid)
+        if worker:
+            # Stays registered until it reports back, so on_worker_finish treats it as its own
+            worker.stop()
             self.status_var.set(self.t("status_stopped"))
             # Update the display
-            if str(idx) in self.tree.get_children():
-                values = list(self.tree.item(str(idx), "values"))
-                values[2] = f"{values[2]} ({self.t('tag_stop')})"
-                self.tree.item(str(idx), values=values)
+            if self.tree.exists(uid):
+                elapsed_text = self._row_value(uid, "elapsed")
+                self._queue_row_update(uid, elapsed=f"{elapsed_text} ({self.t('tag_stop')})")
 
     def obtain_cookies_interactively(self, url, domain):
         try:
@@ -2556,6 +3297,7 @@ class App(ctk.CTk):
         messagebox.showinfo(self.t("action_required"), self.t("sign_in_and_click_ok"))
         try:
             CookieManager.save_cookies(drv, domain)
+            self._cookie_present_domains.add(domain)
             messagebox.showinfo(
                 self.t("ok"), self.t("cookies_saved_for", domain=domain)
             )
@@ -2588,7 +3330,7 @@ class App(ctk.CTk):
             pass
 
         # Stop and close all Selenium drivers from workers
-        for idx, w in list(self.workers.items()):
+        for w in list(self.workers.values()):
             try:
                 w.stop()
             except Exception:
@@ -2602,10 +3344,36 @@ class App(ctk.CTk):
             except Exception:
                 pass
 
-        # Wait briefly for threads to stop
-        for idx, w in list(self.workers.items()):
+        try:
+            self._probe_pool.shutdown(wait=False, cancel_futures=True)
+            self._warmup_pool.shutdown(wait=False, cancel_futures=True)
+            self._image_pool.shutdown(wait=False, cancel_futures=True)
+            self._browser_pool.shutdown(wait=False, cancel_futures=True)
+        except Exception:
+            pass
+        if self._browser_driver is not None:
             try:
-                w.join(timeout=2.5)
+                self._browser_driver.quit()
+            except Exception:
+                pass
+
+        # Let queued background writes land, then persist the final state
+        # (write_snapshot skips it when nothing changed)
+        try:
+            self._save_pool.shutdown(wait=True)
+            self._config_dirty = False
+            self.config_data.save()
+        except Exception:
+            pass
+
+        # Wait briefly for threads to stop; one shared deadline for all of them
+        deadline = time.monotonic() + 2.5
+        for w in list(self.workers.values()):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                w.join(timeout=remaining)
             except Exception:
                 pass
 
@@ -2617,16 +3385,18 @@ class App(ctk.CTk):
 
     def connect_to_kick(self):
         sel = self.tree.selection()
-        if sel:
-            idx = int(sel[0])
-            url = self.config_data.items[idx]["url"]
-            domain = domain_from_url(url)
+        idx = self._index_of_uid(sel[0]) if sel else None
+        if idx is not None:
+            item = self.config_data.items[idx]
+            url = item["url"]
+            domain, _ = _item_cookie_target(item)
         else:
             url = "https://kick.com"
             domain = "kick.com"
         # Attempt automatic cookie import from browser
         try:
             if CookieManager.import_from_browser(domain):
+                self._cookie_present_domains.add(domain)
                 messagebox.showinfo(
                     self.t("ok"), self.t("cookies_saved_for", domain=domain)
                 )
@@ -2647,7 +3417,7 @@ class App(ctk.CTk):
         if not path:
             return
         self.config_data.chromedriver_path = path
-        self.config_data.save()
+        self._mark_dirty()
         messagebox.showinfo(self.t("ok"), self.t("chromedriver_set", path=path))
 
     def choose_extension(self):
@@ -2658,7 +3428,7 @@ class App(ctk.CTk):
         if not path:
             return
         self.config_data.extension_path = path
-        self.config_data.save()
+        self._mark_dirty()
         messagebox.showinfo(self.t("ok"), self.t("extension_set", path=path))
 
     def show_drops_window(self):
@@ -2667,6 +3437,13 @@ class App(ctk.CTk):
         drops_window.title(self.t("drops_title"))
         drops_window.geometry("1000x700")
         drops_window.minsize(900, 600)
+        # The tooltip window is shared and outlives this one. A Toplevel's <Destroy>
+        # binding also fires for each destroyed descendant, so only react to the window
+        drops_window.bind(
+            "<Destroy>",
+            lambda event: self._hide_tooltip() if event.widget is drops_window else None,
+            add="+",
+        )
         
         # Keep window on top
         drops_window.attributes('-topmost', True)
@@ -2714,65 +3491,68 @@ class App(ctk.CTk):
         )
         refresh_btn.grid(row=0, column=1, padx=20, pady=15)
 
-        # Refresh function for buttons
+        # Refresh function for buttons (_refresh_drops does its work on the browser thread)
         def refresh_callback():
-            threading.Thread(target=lambda: self._refresh_drops(scrollable_frame, status_label), daemon=True).start()
+            self._refresh_drops(scrollable_frame, status_label)
         
         # Store reference for buttons
         self._current_drops_refresh = refresh_callback
         
-        # Load initial campaigns in a separate thread
-        def load_and_focus():
-            self._refresh_drops(scrollable_frame, status_label)
-            # Bring window to front after loading
-            try:
-                drops_window.lift()
-                drops_window.focus_force()
-            except:
-                pass
-        
-        threading.Thread(target=load_and_focus, daemon=True).start()
+        # Load initial campaigns in the background
+        self._refresh_drops(scrollable_frame, status_label)
+        # Bring window to front
+        try:
+            drops_window.lift()
+            drops_window.focus_force()
+        except:
+            pass
 
     def _refresh_drops(self, scrollable_frame, status_label):
         """Refreshes the list of drop campaigns with integrated progress"""
 
+        # Game sections (frame + header) are kept across refreshes and only their
+        # campaign cards are rebuilt; they live as long as this drops window
+        if not hasattr(scrollable_frame, "_game_sections"):
+            scrollable_frame._game_sections = {}
+        game_sections = scrollable_frame._game_sections
+        # A newer refresh of the same window makes this one stale: it stops fetching
+        # and never builds. Other drops windows keep their own counter.
+        gen = scrollable_frame._drops_gen = getattr(scrollable_frame, "_drops_gen", 0) + 1
+
         # Clean the frame
         def clear_frame():
+            pooled_frames = {id(section["frame"]): section for section in game_sections.values()}
             for widget in scrollable_frame.winfo_children():
-                widget.destroy()
-            status_label.configure(text=self.t("drops_loading"))
+                section = pooled_frames.get(id(widget))
+                if section is None:
+                    widget.destroy()
+                    continue
+                widget.grid_remove()
+                for card in section["container"].winfo_children():
+                    card.destroy()
+            self._set_status_later(status_label, self.t("drops_loading"))
 
         self.after(0, clear_frame)
 
-        def display_campaigns():
-            driver = None
+        def compute_plan():
+            """Fetch and prepare everything off the Tk thread; widgets are built in build_widgets"""
+            if gen != scrollable_frame._drops_gen:
+                return
             try:
-                # Fetch both campaigns and progress using a single Chrome instance
-                result = fetch_drops_campaigns_and_progress()
+                # Fetch both campaigns and progress with the shared hidden browser
+                result = fetch_drops_campaigns_and_progress(driver=self._api_driver())
                 campaigns = result.get("campaigns", [])
                 progress_data = result.get("progress", [])
                 progress_data = [p for p in progress_data if isinstance(p, dict)]
-                driver = result.get("driver")
                 
+                if gen != scrollable_frame._drops_gen:
+                    return
                 if not campaigns:
-                    status_label.configure(text=self.t("drops_error"))
-                    no_data_label = ctk.CTkLabel(
-                        scrollable_frame,
-                        text=self.t("drops_error"),
-                        font=ctk.CTkFont(size=12),
-                        text_color="gray",
-                    )
-                    no_data_label.grid(row=0, column=0, pady=20)
+                    self._post_to_ui(show_no_data)
                     return
 
                 # Create a progress lookup by campaign ID
-                progress_by_id = {}
-                for prog in progress_data:
-                    if not isinstance(prog, dict):
-                        continue  # Skip unexpected progress entries
-                    campaign_id = prog.get("id")
-                    if campaign_id:
-                        progress_by_id[campaign_id] = prog
+                progress_by_id = {p["id"]: p for p in progress_data if p.get("id")}
                 
                 # Merge progress data into campaigns
                 for campaign in campaigns:
@@ -2823,210 +3603,252 @@ class App(ctk.CTk):
                 expired_campaigns = []
                 
                 for campaign in campaigns:
-                    if is_campaign_expired(campaign):
-                        expired_campaigns.append(campaign)
-                    else:
-                        active_campaigns.append(campaign)
+                    campaign["_expired"] = is_campaign_expired(campaign)
+                    (expired_campaigns if campaign["_expired"] else active_campaigns).append(campaign)
                 
                 # Group active campaigns by game and sort by progress status
+                # Priority: in progress > not started > claimed/completed
+                status_ranks = {"in progress": 0, "not_started": 1, "claimed": 2}
                 games = {}
                 for campaign in active_campaigns:
-                    # Double-check: skip if expired (safety check)
-                    if is_campaign_expired(campaign):
-                        continue
                     game_name = campaign["game"]
                     if game_name not in games:
                         games[game_name] = {
                             "image": campaign.get("game_image", ""),
                             "campaigns": [],
+                            "_has_in_progress": False,
+                            "_has_not_started": False,
                         }
-                    games[game_name]["campaigns"].append(campaign)
-                
-                # Sort campaigns within each game by progress status
-                # Priority: in progress > not started > claimed/completed
-                def sort_key(campaign):
-                    status = campaign.get("progress_status", "not_started")
-                    if status == "in progress":
-                        return 0
-                    elif status == "not_started":
-                        return 1
-                    elif status == "claimed":
-                        return 2
-                    else:
-                        return 3
+                    game_data = games[game_name]
+                    rank = status_ranks.get(campaign.get("progress_status", "not_started"), 3)
+                    campaign["_status_rank"] = rank
+                    if rank == 0:
+                        game_data["_has_in_progress"] = True
+                    elif rank == 1:
+                        game_data["_has_not_started"] = True
+                    game_data["campaigns"].append(campaign)
                 
-                for game_name, game_data in games.items():
-                    game_data["campaigns"].sort(key=sort_key)
+                for game_data in games.values():
+                    game_data["campaigns"].sort(key=lambda c: c["_status_rank"])
                 
                 # Sort games by priority: games with in-progress campaigns first
                 def game_priority(game_data):
-                    campaigns = game_data["campaigns"]
-                    # Check if any campaign is in progress
-                    has_in_progress = any(c.get("progress_status") == "in progress" for c in campaigns)
-                    if has_in_progress:
+                    if game_data["_has_in_progress"]:
                         return 0
-                    # Check if any campaign is not started
-                    has_not_started = any(c.get("progress_status") == "not_started" for c in campaigns)
-                    if has_not_started:
+                    if game_data["_has_not_started"]:
                         return 1
                     return 2
                 
-                # Convert to list, sort, then back to dict (or use OrderedDict)
+                # Sorted (game_name, game_data) pairs; build_widgets iterates them in order
                 games_list = sorted(games.items(), key=lambda x: game_priority(x[1]))
-                games = dict(games_list)
 
-                status_text = self.t("drops_loaded", count=len(active_campaigns))
-                if expired_campaigns:
-                    status_text += f" ({len(expired_campaigns)} expired)"
-                status_label.configure(text=status_text)
-
-                # Add toggle for showing expired campaigns
-                if not hasattr(scrollable_frame, "_show_expired_var"):
-                    scrollable_frame._show_expired_var = tk.BooleanVar(value=False)
-                
-                show_expired = scrollable_frame._show_expired_var.get()
-                
-                # Display each game with its campaigns
-                row_idx = 0
-                for game_name, game_data in games.items():
-                    # Separate campaigns into active and completed
-                    game_active_campaigns = []
-                    game_completed_campaigns = []
-                    
+                # Separate each game's campaigns into active and completed
+                for game_data in games.values():
+                    game_data["active"] = []
+                    game_data["completed"] = []
                     for campaign in game_data["campaigns"]:
                         status = campaign.get("progress_status", "not_started")
                         if status == "claimed":
-                            game_completed_campaigns.append(campaign)
+                            game_data["completed"].append(campaign)
                         else:
-                            game_active_campaigns.append(campaign)
-                    # Frame for game (collapsible) - improved style
-                    game_frame = ctk.CTkFrame(
-                        scrollable_frame, 
-                        corner_radius=12,
-                        border_width=2,
-                        border_color=("#3b82f6", "#2563eb")
-                    )
-                    game_frame.grid(row=row_idx, column=0, sticky="ew", padx=0, pady=10)
-                    game_frame.grid_columnconfigure(0, weight=1)
-
-                    # Variable for toggle collapse
-                    is_expanded = tk.BooleanVar(value=True)
-
-                    # Game header (clickable to collapse/expand) - larger and colored
-                    game_header = ctk.CTkFrame(
-                        game_frame, 
-                        fg_color=("#e0f2fe", "#1e3a5f"),
-                        cursor="hand2",
-                        corner_radius=10
-                    )
-                    game_header.grid(row=0, column=0, sticky="ew", padx=3, pady=3)
-                    # Don't expand any column - let content determine width
-                    game_header.grid_columnconfigure(3, weight=1)  # Expand the empty space column
-
-                    # Expand/collapse icon - more visible
-                    collapse_icon = ctk.CTkLabel(
-                        game_header, 
-                        text="▼", 
-                        font=ctk.CTkFont(size=14, weight="bold"),
-                        text_color=("#3b82f6", "#60a5fa")
-                    )
-                    collapse_icon.grid(row=0, column=0, padx=(15, 10), pady=12)
-
-                    # Game image (if available) - larger
-                    col_offset = 1
-                    if game_data["image"]:
-                        try:
-                            # Download and display game image
-                            with urllib.request.urlopen(
-                                game_data["image"], timeout=3
-                            ) as response:
-                                image_data = response.read()
-                            game_img = Image.open(BytesIO(image_data))
-                            game_img = game_img.resize(
-                                (48, 48), Image.Resampling.LANCZOS
-                            )
-                            game_photo = ctk.CTkImage(
-                                light_image=game_img, dark_image=game_img, size=(48, 48)
-                            )
+                            game_data["active"].append(campaign)
 
-                            img_label = ctk.CTkLabel(
-                                game_header, image=game_photo, text="", cursor="hand2"
-                            )
-                            img_label.image = game_photo
-                            img_label.grid(row=0, column=1, padx=(0, 12))
-                            col_offset = 2
-                        except Exception as e:
-                            print(f"Could not load game image: {e}")
-
-                    # Game name - larger and colored
-                    game_label = ctk.CTkLabel(
-                        game_header,
-                        text=game_name,
-                        font=ctk.CTkFont(size=20, weight="bold"),
-                        text_color=("#1e40af", "#93c5fd")
-                    )
-                    game_label.grid(row=0, column=col_offset, sticky="w", padx=(0, 0))
-                    
-                    # Spacer column to push badge to the right
-                    # (column 3 has weight=1)
-
-                    # Number of campaigns - styled badge, aligned right
-                    count_label = ctk.CTkLabel(
-                        game_header,
-                        text=f"{len(game_data['campaigns'])} campaign{'s' if len(game_data['campaigns']) > 1 else ''}",
-                        font=ctk.CTkFont(size=11, weight="bold"),
-                        fg_color=("#bfdbfe", "#1e40af"),
-                        corner_radius=12,
-                        padx=10,
-                        pady=4
-                    )
-                    count_label.grid(row=0, column=4, sticky="e", padx=(15, 15))
+                # Download all uncached game images concurrently before building headers
+                urls_to_fetch = {
+                    g["image"]
+                    for g in games.values()
+                    if g["image"] and (g["image"], (48, 48)) not in self._image_cache
+                }
+                if urls_to_fetch and not self._prefetch_images(self._prefetch_game_image, urls_to_fetch, scrollable_frame, gen):
+                    return
+
+                # Decode reward images up front so building the cards never hits the network
+                reward_urls = {
+                    _reward_image_url(reward)
+                    for campaign in campaigns
+                    for reward in campaign.get("rewards", [])[:6]
+                }
+                reward_urls.discard("")
+                reward_urls = {u for u in reward_urls if (u, (50, 50)) not in self._image_cache}
+                if reward_urls and not self._prefetch_images(self._prefetch_reward_image, reward_urls, scrollable_frame, gen):
+                    return
+
+                plan = {
+                    "games": games_list,
+                    "active_count": len(active_campaigns),
+                    "expired": expired_campaigns,
+                }
+                self._post_to_ui(build_widgets, plan)
+            except Exception as e:
+                self._set_status_later(status_label, f"Error: {str(e)}")
+                import traceback
+                traceback.print_exc()
+
+        def show_no_data():
+            error_text = self.t("drops_error")
+            self._set_status_later(status_label, error_text)
+            no_data_label = ctk.CTkLabel(
+                scrollable_frame,
+                text=error_text,
+                font=self._font(size=12),
+                text_color="gray",
+            )
+            no_data_label.grid(row=0, column=0, pady=20)
+
+        def make_game_section(game_name, game_data):
+            """Create a game's frame, clickable header and campaigns container"""
+            # Frame for game (collapsible) - improved style
+            game_frame = ctk.CTkFrame(
+                scrollable_frame, 
+                corner_radius=12,
+                border_width=2,
+                border_color=("#3b82f6", "#2563eb")
+            )
+            game_frame.grid_columnconfigure(0, weight=1)
+
+            # Variable for toggle collapse
+            is_expanded = tk.BooleanVar(value=True)
 
-                    # Campaigns frame (can be hidden)
-                    campaigns_container = ctk.CTkFrame(
-                        game_frame, fg_color="transparent"
+            # Game header (clickable to collapse/expand) - larger and colored
+            game_header = ctk.CTkFrame(
+                game_frame, 
+                fg_color=("#e0f2fe", "#1e3a5f"),
+                cursor="hand2",
+                corner_radius=10
+            )
+            game_header.grid(row=0, column=0, sticky="ew", padx=3, pady=3)
+            # Don't expand any column - let content determine width
+            game_header.grid_columnconfigure(3, weight=1)  # Expand the empty space column
+
+            # Expand/collapse icon - more visible
+            collapse_icon = ctk.CTkLabel(
+                game_header, 
+                text="▼", 
+                font=self._font(size=14, weight="bold"),
+                text_color=("#3b82f6", "#60a5fa")
+            )
+            collapse_icon.grid(row=0, column=0, padx=(15, 10), pady=12)
+
+            # Game image (if available) - larger
+            col_offset = 1
+            img_label = None
+            if game_data["image"]:
+                # Prefetched by compute_plan; a failed download leaves the header without image
+                game_photo = self._cached_image(game_data["image"], (48, 48))
+                if game_photo is not None:
+                    img_label = ctk.CTkLabel(
+                        game_header, image=game_photo, text="", cursor="hand2"
                     )
-                    campaigns_container.grid(row=1, column=0, sticky="ew")
-                    campaigns_container.grid_columnconfigure(0, weight=1)
-
-                    # Fonction toggle
-                    def toggle_collapse(
-                        event=None,
-                        icon=collapse_icon,
-                        container=campaigns_container,
-                        var=is_expanded,
-                    ):
-                        if var.get():
-                            container.grid_remove()
-                            icon.configure(text="▶")
-                            var.set(False)
-                        else:
-                            container.grid()
-                            icon.configure(text="▼")
-                            var.set(True)
-
-                    # Make header clickable
-                    game_header.bind("<Button-1>", toggle_collapse)
-                    game_label.bind("<Button-1>", toggle_collapse)
-                    collapse_icon.bind("<Button-1>", toggle_collapse)
-                    count_label.bind("<Button-1>", toggle_collapse)
-                    # Bind img_label if it exists
-                    for widget in game_header.winfo_children():
-                        if isinstance(widget, ctk.CTkLabel) and hasattr(
-                            widget, "image"
-                        ):
-                            widget.bind("<Button-1>", toggle_collapse)
+                    img_label.grid(row=0, column=1, padx=(0, 12))
+                    col_offset = 2
+
+            # Game name - larger and colored
+            game_label = ctk.CTkLabel(
+                game_header,
+                text=game_name,
+                font=self._font(size=20, weight="bold"),
+                text_color=("#1e40af", "#93c5fd")
+            )
+            game_label.grid(row=0, column=col_offset, sticky="w", padx=(0, 0))
+
+            # Spacer column to push badge to the right
+            # (column 3 has weight=1)
+
+            # Number of campaigns - styled badge, aligned right
+            count_label = ctk.CTkLabel(
+                game_header,
+                text="",
+                font=self._font(size=11, weight="bold"),
+                fg_color=("#bfdbfe", "#1e40af"),
+                corner_radius=12,
+                padx=10,
+                pady=4
+            )
+            count_label.grid(row=0, column=4, sticky="e", padx=(15, 15))
+
+            # Campaigns frame (can be hidden)
+            campaigns_container = ctk.CTkFrame(
+                game_frame, fg_color="transparent"
+            )
+            campaigns_container.grid(row=1, column=0, sticky="ew")
+            campaigns_container.grid_columnconfigure(0, weight=1)
+
+            # Fonction toggle
+            def toggle_collapse(
+                event=None,
+                icon=collapse_icon,
+                container=campaigns_container,
+                var=is_expanded,
+            ):
+                if var.get():
+                    container.grid_remove()
+                    icon.configure(text="▶")
+                    var.set(False)
+                else:
+                    container.grid()
+                    icon.configure(text="▼")
+                    var.set(True)
+
+            # Make header clickable
+            game_header.bind("<Button-1>", toggle_collapse)
+            game_label.bind("<Button-1>", toggle_collapse)
+            collapse_icon.bind("<Button-1>", toggle_collapse)
+            count_label.bind("<Button-1>", toggle_collapse)
+            if img_label is not None:
+                img_label.bind("<Button-1>", toggle_collapse)
+
+            return {
+                "frame": game_frame,
+                "count": count_label,
+                "container": campaigns_container,
+                "image": game_data["image"],
+            }
+
+        def build_widgets(plan):
+            """Create the drops widgets from a prepared plan (Tk thread)"""
+            if gen != scrollable_frame._drops_gen:
+                return
+            games_list = plan["games"]
+            expired_campaigns = plan["expired"]
+            try:
+
+                status_text = self.t("drops_loaded", count=plan["active_count"])
+                if expired_campaigns:
+                    status_text += f" ({len(expired_campaigns)} expired)"
+                self._set_status_later(status_label, status_text)
+
+                # Display each game with its campaigns
+                row_idx = 0
+                used_sections = {}
+                completed_title = self.t("drops_completed_campaigns")
+                # Queue URLs at build time, shared by every card built now (lazy cards take a fresh one)
+                added_urls = {item["url"] for item in self.config_data.items}
+                for game_name, game_data in games_list:
+                    # Campaigns were split into active and completed by compute_plan
+                    game_active_campaigns = game_data["active"]
+                    game_completed_campaigns = game_data["completed"]
+                    section = game_sections.pop(game_name, None)
+                    if section is not None and section["image"] != game_data["image"]:
+                        section["frame"].destroy()
+                        section = None
+                    if section is None:
+                        section = make_game_section(game_name, game_data)
+                    used_sections[game_name] = section
+                    section["frame"].grid(row=row_idx, column=0, sticky="ew", padx=0, pady=10)
+                    count = len(game_data["campaigns"])
+                    section["count"].configure(text=f"{count} campaign{'s' if count > 1 else ''}")
+                    campaigns_container = section["container"]
 
                     # Display active campaigns first
                     camp_idx = 0
-                    for campaign in active_campaigns:
-                        self._create_campaign_display(campaigns_container, campaign, camp_idx, scrollable_frame, game_data, status_label)
+                    for campaign in game_active_campaigns:
+                        self._create_campaign_display(campaigns_container, campaign, camp_idx, scrollable_frame, game_data, status_label, added_urls)
                         camp_idx += 1
                     
                     # Display completed campaigns in a collapsible section
                     if game_completed_campaigns:
                         # Add separator if there are active campaigns
-                        if active_campaigns:
+                        if game_active_campaigns:
                             separator = ctk.CTkFrame(campaigns_container, fg_color="transparent", height=2)
                             separator.grid(row=camp_idx, column=0, sticky="ew", padx=8, pady=6)
                             camp_idx += 1
@@ -3046,15 +3868,15 @@ class App(ctk.CTk):
                         completed_collapse_icon = ctk.CTkLabel(
                             completed_header_frame,
                             text="▶",
-                            font=ctk.CTkFont(size=12, weight="bold"),
+                            font=self._font(size=12, weight="bold"),
                             text_color=("gray60", "gray40")
                         )
                         completed_collapse_icon.grid(row=0, column=0, padx=(12, 8), pady=8)
                         
                         completed_header_label = ctk.CTkLabel(
                             completed_header_frame,
-                            text=f"{self.t('drops_completed_campaigns')} ({len(game_completed_campaigns)})",
-                            font=ctk.CTkFont(size=12, weight="bold"),
+                            text=f"{completed_title} ({len(game_completed_campaigns)})",
+                            font=self._font(size=12, weight="bold"),
                             text_color=("gray60", "gray40")
                         )
                         completed_header_label.grid(row=0, column=1, sticky="w", padx=(0, 12), pady=8)
@@ -3068,63 +3890,160 @@ class App(ctk.CTk):
                         completed_container.grid_columnconfigure(0, weight=1)
                         completed_container.grid_remove()  # Hidden by default
                         
-                        def toggle_completed(event=None):
-                            if completed_expanded.get():
-                                completed_container.grid_remove()
-                                completed_collapse_icon.configure(text="▶")
-                                completed_expanded.set(False)
+                        # Completed cards are only built the first time the section is opened
+                        def toggle_completed(
+                            event=None,
+                            icon=completed_collapse_icon,
+                            container=completed_container,
+                            var=completed_expanded,
+                            unbuilt=[(game_completed_campaigns, game_data)],
+                        ):
+                            if var.get():
+                                container.grid_remove()
+                                icon.configure(text="▶")
+                                var.set(False)
                             else:
-                                completed_container.grid()
-                                completed_collapse_icon.configure(text="▼")
-                                completed_expanded.set(True)
+                                if unbuilt:
+                                    campaigns, data = unbuilt.pop()
+                                    for comp_idx, campaign in enumerate(campaigns):
+                                        self._create_campaign_display(container, campaign, comp_idx, scrollable_frame, data, status_label)
+                                container.grid()
+                                icon.configure(text="▼")
+                                var.set(True)
                         
                         completed_header_frame.bind("<Button-1>", toggle_completed)
                         completed_collapse_icon.bind("<Button-1>", toggle_completed)
                         completed_header_label.bind("<Button-1>", toggle_completed)
                         
-                        # Display completed campaigns
-                        for comp_idx, campaign in enumerate(game_completed_campaigns):
-                            self._create_campaign_display(completed_container, campaign, comp_idx, scrollable_frame, game_data, status_label)
-                        
                         camp_idx += 2  # Skip header and container rows
                     
                     row_idx += 1
                 
-                # Display expired campaigns section if toggle is on
-                if expired_campaigns and hasattr(scrollable_frame, "_show_expired_var") and scrollable_frame._show_expired_var.get():
-                        expired_separator = ctk.CTkFrame(scrollable_frame, fg_color=("gray70", "gray30"), height=2)
-                        expired_separator.grid(row=row_idx, column=0, sticky="ew", padx=0, pady=15)
-                        row_idx += 1
-                        
-                        expired_label = ctk.CTkLabel(
-                            scrollable_frame,
-                            text=f"⏰ Expired Campaigns ({len(expired_campaigns)})",
-                            font=ctk.CTkFont(size=14, weight="bold"),
-                            text_color=("#6b7280", "#9ca3af"),
+                # Expired campaigns: only a button until the user asks for them
+                if expired_campaigns:
+                    expired_separator = ctk.CTkFrame(scrollable_frame, fg_color=("gray70", "gray30"), height=2)
+                    expired_separator.grid(row=row_idx, column=0, sticky="ew", padx=0, pady=15)
+                    row_idx += 1
+                    
+                    count = len(expired_campaigns)
+                    expired_btn = ctk.CTkButton(
+                        scrollable_frame,
+                        text=f"⏰ Show {count} expired campaign{'s' if count > 1 else ''}",
+                        height=32,
+                        font=self._font(size=12, weight="bold"),
+                        fg_color=("gray80", "#374151"),
+                        hover_color=("gray70", "#4b5563"),
+                        text_color=("#374151", "#d1d5db"),
+                        corner_radius=8,
+                    )
+                    expired_btn.grid(row=row_idx, column=0, sticky="w", padx=15, pady=10)
+                    expired_btn.configure(
+                        command=functools.partial(
+                            self._populate_expired, scrollable_frame, expired_campaigns, status_label, expired_btn, row_idx
                         )
-                        expired_label.grid(row=row_idx, column=0, sticky="w", padx=15, pady=10)
-                        row_idx += 1
-                        
-                        for exp_idx, campaign in enumerate(expired_campaigns):
-                            self._create_campaign_display(scrollable_frame, campaign, exp_idx, scrollable_frame, {"image": ""}, status_label)
-                            row_idx += 1
+                    )
+                    row_idx += 1
                 
-                # Force update
-                scrollable_frame.update_idletasks()
+                # Games that dropped out of the list are not coming back soon
+                for section in game_sections.values():
+                    section["frame"].destroy()
+                game_sections.clear()
+                game_sections.update(used_sections)
             except Exception as e:
-                status_label.configure(text=f"Error: {str(e)}")
+                self._set_status_later(status_label, f"Error: {str(e)}")
                 import traceback
                 traceback.print_exc()
-            finally:
-                # Close driver after displaying all campaigns
-                if driver:
-                    try:
-                        driver.quit()
-                    except:
-                        pass
 
-        # Call on UI thread in background to avoid blocking
-        threading.Thread(target=display_campaigns, daemon=True).start()
+        # Fetch and sort in the background; widgets are created on the Tk thread
+        self._browser_pool.submit(compute_plan)
+
+    def _api_driver(self):
+        """Hidden kick.com browser kept open between drops jobs (browser thread only).
+        Reopened when it died or when the saved kick.com cookies changed.
+        """
+        try:
+            cookie_mtime = os.path.getmtime(cookie_file_for_domain("kick.com"))
+        except OSError:
+            cookie_mtime = None
+        driver = self._browser_driver
+        if driver is not None:
+            try:
+                if cookie_mtime == self._browser_cookie_mtime:
+                    driver.current_url  # Raises if the browser is gone
+                    return driver
+            except Exception:
+                pass
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            self._browser_driver = None
+        self._browser_driver = open_kick_api_driver()
+        self._browser_cookie_mtime = cookie_mtime
+        return self._browser_driver
+
+    def _font(self, **options):
+        """Shared CTkFont for these options, so drops cards don't each allocate one"""
+        key = tuple(sorted(options.items()))
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = ctk.CTkFont(**options)
+        return font
+
+    def _cached_image(self, url, size):
+        """CTkImage for url at size from memory or the resized tile on disk, else None.
+        Never touches the network, so the Tk thread can call it."""
+        key = (url, size)
+        photo = self._image_cache.get(key)
+        if photo is None:
+            img = _load_thumb_tile(url, size)
+            if img is None:
+                return None
+            photo = self._image_cache[key] = ctk.CTkImage(
+                light_image=img, dark_image=img, size=size
+            )
+        return photo
+
+    def _fetch_image(self, url, size, headers=None, timeout=5):
+        """CTkImage for url at size, downloading and decoding it when not cached (image pool only).
+        Resized pixels are kept on disk as raw RGBA so later sessions skip decoding and resizing.
+        """
+        photo = self._cached_image(url, size)
+        if photo is None:
+            image_data = _cached_image_bytes(url, headers=headers, timeout=timeout)
+            img = Image.open(BytesIO(image_data))
+            img.draft("RGB", size)  # JPEG: let the decoder downscale
+            # Thumbnails are tiny, so LANCZOS buys nothing visible; BOX is cheapest for small sources
+            resample = Image.Resampling.BOX if max(img.size) <= 100 else Image.Resampling.BILINEAR
+            img = img.resize(size, resample).convert("RGBA")
+            _store_thumb(_thumb_tile_path(url, size), img.tobytes())
+            photo = self._image_cache[(url, size)] = ctk.CTkImage(
+                light_image=img, dark_image=img, size=size
+            )
+        return photo
+
+    def _prefetch_images(self, prefetch, urls, scrollable_frame, gen):
+        """Run prefetch(url) for urls on the image pool; False (queued ones cancelled) once
+        refresh gen of that drops window has been superseded."""
+        futures = [self._image_pool.submit(prefetch, url) for url in urls]
+        for fut in as_completed(futures):
+            if gen != scrollable_frame._drops_gen:
+                for f in futures:
+                    f.cancel()
+                return False
+        return True
+
+    def _prefetch_game_image(self, url):
+        try:
+            self._fetch_image(url, (48, 48), timeout=3)
+        except Exception:
+            pass  # The header is built without the image
+
+    def _prefetch_reward_image(self, url):
+        try:
+            self._fetch_image(url, (50, 50), headers=_KICK_CDN_HEADERS, timeout=5)
+        except Exception:
+            pass  # The card is built without this reward
 
     def _auto_find_streamers_for_game(self, campaign, category_id, scrollable_frame, status_label):
         """Auto-find and add live streamers for a global drop campaign"""
@@ -3135,91 +4054,80 @@ class App(ctk.CTk):
             debug_print(f"DEBUG: Game: {game_name}")
             debug_print(f"DEBUG: Category ID: {category_id}")
             
-            status_label.configure(text=f"🔍 Searching for live streamers of {game_name}...")
+            self._set_status_later(status_label, f"🔍 Searching for live streamers of {game_name}...")
             
-            # Use existing driver from drops window if available, or create new one
+            # Reuse the drops window's hidden browser; fall back to a throwaway one
             driver = None
             try:
-                debug_print("DEBUG: Attempting to get driver from drops fetch...")
-                # Try to get driver from current drops fetch
-                result = fetch_drops_campaigns_and_progress()
-                driver = result.get("driver")
-                if driver:
-                    debug_print("DEBUG: Reusing existing driver")
-                else:
-                    debug_print("DEBUG: No existing driver, will create new one")
+                driver = self._api_driver()
             except Exception as e:
                 debug_print(f"DEBUG: Error getting driver: {e}")
-                pass
             
             debug_print(f"DEBUG: Calling fetch_live_streamers_by_category with category_id={category_id}")
             streamers = fetch_live_streamers_by_category(category_id, limit=24, driver=driver)
             debug_print(f"DEBUG: Found {len(streamers)} streamers")
             
             if not streamers:
-                status_label.configure(text=f"❌ No live streamers found for {game_name}")
-                debug_print(f"DEBUG: No streamers found, closing driver if needed")
-                if driver:
-                    try:
-                        driver.quit()
-                    except:
-                        pass
+                self._set_status_later(status_label, f"❌ No live streamers found for {game_name}")
                 return
             
             debug_print(f"DEBUG: Processing {len(streamers)} streamers to add to queue")
-            status_label.configure(text=f"📝 Adding {len(streamers)} streamer(s) to queue...")
+            self._set_status_later(status_label, f"📝 Adding {len(streamers)} streamer(s) to queue...")
             
-            # Calculate maximum required time from rewards (cumulative drops)
+            # Maximum required time from rewards (cumulative drops), 120 if none
             rewards = campaign.get("rewards", [])
-            max_required_minutes = 0
-            for reward in rewards:
-                required_units = reward.get("required_units", 0)
-                if required_units > max_required_minutes:
-                    max_required_minutes = required_units
-            
-            # If no rewards found, default to 120
-            if max_required_minutes == 0:
-                max_required_minutes = 120
+            max_required_minutes = _campaign_minutes(campaign)
             
             debug_print(f"DEBUG: Campaign has {len(rewards)} rewards, max required: {max_required_minutes} minutes")
             
-            # Add all found streamers to queue
+            # Config and tree are Tk-thread only; hand the results over in one callback
+            self._post_to_ui(add_found, streamers, max_required_minutes, game_name)
+
+        def add_found(streamers, max_required_minutes, game_name):
             count = 0
             skipped = 0
             campaign_id = campaign.get("id")
             all_streamers = [{"url": s["url"], "username": s["username"]} for s in streamers]
             
+            debug = _debug_enabled()
             for streamer in streamers:
                 try:
                     url = streamer["url"]
                     username = streamer.get("username", "unknown")
-                    debug_print(f"DEBUG: Processing streamer: {username} ({url})")
+                    if debug:
+                        debug_print(f"DEBUG: Processing streamer: {username} ({url})")
                     
                     if self._is_channel_in_list(url):
-                        debug_print(f"DEBUG: Streamer {username} already in list, skipping")
+                        if debug:
+                            debug_print(f"DEBUG: Streamer {username} already in list, skipping")
                         skipped += 1
                         continue
                     
                     # Store all streamers as alternatives for each other
                     # Use max_required_minutes for cumulative drops
-                    debug_print(f"DEBUG: Adding {username} to queue with target: {max_required_minutes} minutes")
+                    if debug:
+                        debug_print(f"DEBUG: Adding {username} to queue with target: {max_required_minutes} minutes")
                     self.config_data.add(
                         url, 
                         max_required_minutes, 
                         campaign_id, 
                         all_streamers,
                         required_category_id=category_id,
-                        is_global_drop=True
+                        is_global_drop=True,
+                        save=False,
                     )
                     count += 1
                 except Exception as e:
-                    debug_print(f"DEBUG: Error adding streamer {streamer.get('username', 'unknown')}: {e}")
+                    if debug:
+                        debug_print(f"DEBUG: Error adding streamer {streamer.get('username', 'unknown')}: {e}")
                     import traceback
                     traceback.print_exc()
             
             debug_print(f"DEBUG: Added {count} streamers, skipped {skipped} (already in list)")
+            if count:
+                self._mark_dirty()
             self.refresh_list()
-            status_label.configure(text=f"✅ Added {count} live streamer(s) for {game_name}" + (f" ({skipped} already in list)" if skipped > 0 else ""))
+            self._set_status_later(status_label, f"✅ Added {count} live streamer(s) for {game_name}" + (f" ({skipped} already in list)" if skipped > 0 else ""))
             
             # Auto-start if enabled
             if self.config_data.auto_start and not self.queue_running:
@@ -3227,18 +4135,28 @@ class App(ctk.CTk):
                 self.after(500, self._auto_start_queue)
             else:
                 debug_print("DEBUG: Auto-start disabled or queue already running")
-            
-            if driver:
-                try:
-                    debug_print("DEBUG: Closing driver")
-                    driver.quit()
-                except Exception as e:
-                    debug_print(f"DEBUG: Error closing driver: {e}")
         
-        threading.Thread(target=find_and_add, daemon=True).start()
+        self._browser_pool.submit(find_and_add)
+
+    def _populate_expired(self, scrollable_frame, expired_campaigns, status_label, button, row):
+        """Replace the "show expired" button at row with the expired campaign cards"""
+        button.destroy()
+        expired_label = ctk.CTkLabel(
+            scrollable_frame,
+            text=f"⏰ Expired Campaigns ({len(expired_campaigns)})",
+            font=self._font(size=14, weight="bold"),
+            text_color=("#6b7280", "#9ca3af"),
+        )
+        expired_label.grid(row=row, column=0, sticky="w", padx=15, pady=10)
+        for exp_idx, campaign in enumerate(expired_campaigns, start=row + 1):
+            self._create_campaign_display(scrollable_frame, campaign, exp_idx, scrollable_frame, {"image": ""}, status_label)
 
-    def _create_campaign_display(self, parent, campaign, camp_idx, scrollable_frame, game_data, status_label=None):
-        """Helper function to create a campaign display frame"""
+    def _create_campaign_display(self, parent, campaign, camp_idx, scrollable_frame, game_data, status_label=None, added_urls=None):
+        """Helper function to create a campaign display frame.
+        added_urls: set of queued channel URLs used for the initial button states.
+        """
+        if added_urls is None:
+            added_urls = {item["url"] for item in self.config_data.items}
         try:
             campaign_frame = ctk.CTkFrame(
                 parent,
@@ -3260,7 +4178,7 @@ class App(ctk.CTk):
             campaign_name_label = ctk.CTkLabel(
                 header,
                 text=campaign["name"],
-                font=ctk.CTkFont(size=14, weight="bold"),
+                font=self._font(size=14, weight="bold"),
                 anchor="w"
             )
             campaign_name_label.grid(
@@ -3269,23 +4187,19 @@ class App(ctk.CTk):
 
             # Status badge - show progress status if available
             progress_status = campaign.get("progress_status", "not_started")
-            if progress_status == "not_started":
-                status_text = campaign["status"].upper()
-                status_color = ("#10b981", "#059669") if campaign["status"] == "active" else ("#6b7280", "#4b5563")
-            elif progress_status == "in progress":
-                status_text = "IN PROGRESS"
-                status_color = ("#f59e0b", "#d97706")
-            elif progress_status == "claimed":
-                status_text = "CLAIMED"
-                status_color = ("#10b981", "#059669")
-            else:
-                status_text = campaign["status"].upper()
-                status_color = ("#6b7280", "#4b5563")
+            style = _PROGRESS_BADGES.get(progress_status)
+            if style is None:
+                # Not started (or unknown): fall back to the campaign's own status
+                style = (
+                    campaign["status"].upper(),
+                    _BADGE_GREEN if progress_status == "not_started" and campaign["status"] == "active" else _BADGE_GRAY,
+                )
+            status_text, status_color = style
             
             status_badge = ctk.CTkLabel(
                 header,
                 text=status_text,
-                font=ctk.CTkFont(size=10, weight="bold"),
+                font=self._font(size=10, weight="bold"),
                 fg_color=status_color,
                 text_color="white",
                 corner_radius=6,
@@ -3310,7 +4224,7 @@ class App(ctk.CTk):
                 rewards_label = ctk.CTkLabel(
                     rewards_frame,
                     text="🎁 Rewards:",
-                    font=ctk.CTkFont(size=12, weight="bold"),
+                    font=self._font(size=12, weight="bold"),
                     text_color=("#7c3aed", "#a78bfa")
                 )
                 rewards_label.grid(row=0, column=0, sticky="w", padx=(12, 10), pady=10)
@@ -3326,36 +4240,14 @@ class App(ctk.CTk):
                 ):  # Max 6 rewards shown
                     try:
                         # Build complete image URL
-                        reward_img_url = reward.get("image_url", "")
-                        if reward_img_url and not reward_img_url.startswith(
-                            "http"
-                        ):
-                            reward_img_url = (
-                                f"https://ext.cdn.kick.com/{reward_img_url}"
-                            )
+                        reward_img_url = _reward_image_url(reward)
 
                         if reward_img_url:
-                            # CDN images - use simple urllib request with headers
+                            # CDN images were prefetched by compute_plan; skip the ones that failed
                             try:
-                                req = urllib.request.Request(
-                                    reward_img_url,
-                                    headers={
-                                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                                        "Referer": "https://kick.com/"
-                                    }
-                                )
-                                with urllib.request.urlopen(req, timeout=5) as response:
-                                    img_data = response.read()
-
-                                rew_img = Image.open(BytesIO(img_data))
-                                rew_img = rew_img.resize(
-                                    (50, 50), Image.Resampling.LANCZOS
-                                )
-                                rew_photo = ctk.CTkImage(
-                                    light_image=rew_img,
-                                    dark_image=rew_img,
-                                    size=(50, 50),
-                                )
+                                rew_photo = self._cached_image(reward_img_url, (50, 50))
+                                if rew_photo is None:
+                                    continue
 
                                 reward_name = reward.get(
                                     "name", "Unknown"
@@ -3400,7 +4292,6 @@ class App(ctk.CTk):
                                     image=rew_photo,
                                     text="",
                                 )
-                                rew_label.image = rew_photo
                                 rew_label.place(relx=0.5, rely=0.5, anchor="center")
                                 
                                 # Add claimed checkmark overlay if claimed
@@ -3408,7 +4299,7 @@ class App(ctk.CTk):
                                     claimed_overlay = ctk.CTkLabel(
                                         rew_container,
                                         text="✓",
-                                        font=ctk.CTkFont(size=16, weight="bold"),
+                                        font=self._font(size=16, weight="bold"),
                                         text_color="#10b981",
                                         fg_color="transparent"
                                     )
@@ -3444,7 +4335,7 @@ class App(ctk.CTk):
                     global_drop_frame,
                     text=self.t("drops_no_channels"),
                     text_color=("#6b7280", "#9ca3af"),
-                    font=ctk.CTkFont(size=11, slant="italic"),
+                    font=self._font(size=11, slant="italic"),
                 )
                 no_channels_label.grid(row=0, column=0, sticky="w")
                 
@@ -3484,7 +4375,7 @@ class App(ctk.CTk):
                     text="🔍 Find Live Streamers",
                     width=180,
                     height=30,
-                    font=ctk.CTkFont(size=11, weight="bold"),
+                    font=self._font(size=11, weight="bold"),
                     fg_color=("#10b981", "#059669") if category_id else ("#6b7280", "#4b5563"),
                     hover_color=("#059669", "#047857") if category_id else ("#4b5563", "#374151"),
                     command=find_streamers,
@@ -3500,7 +4391,7 @@ class App(ctk.CTk):
                 # List of channels with buttons - improved design
                 for ch_idx, channel in enumerate(campaign["channels"][:5]):
                     channel_url = channel["url"]
-                    is_added = self._is_channel_in_list(channel_url)
+                    is_added = channel_url in added_urls
                     
                     channel_row = ctk.CTkFrame(
                         channels_frame, 
@@ -3517,7 +4408,7 @@ class App(ctk.CTk):
                     ch_label = ctk.CTkLabel(
                         channel_row,
                         text=f"{icon} {channel['username']}",
-                        font=ctk.CTkFont(size=12),
+                        font=self._font(size=12),
                         anchor="w"
                     )
                     ch_label.grid(row=0, column=0, sticky="w", padx=(12, 10), pady=8)
@@ -3528,54 +4419,32 @@ class App(ctk.CTk):
                         text="✗ Remove" if is_added else "+ Add",
                         width=90,
                         height=28,
-                        font=ctk.CTkFont(size=11, weight="bold"),
-                        fg_color=("#ef4444", "#dc2626") if is_added else ("#3b82f6", "#2563eb"),
-                        hover_color=("#dc2626", "#b91c1c") if is_added else ("#2563eb", "#1d4ed8"),
+                        font=self._font(size=11, weight="bold"),
+                        **(_CHANNEL_REMOVE_STYLE if is_added else _CHANNEL_ADD_STYLE),
                         corner_radius=6,
                     )
                     action_btn.grid(row=0, column=1, sticky="e", padx=8, pady=4)
                     
-                    # Store reference to this button
+                    # Store reference to this button; its command is set once add_all_btn exists
                     channel_buttons.append((channel_url, action_btn, ch_label, channel['username']))
-                    
-                    # Function to toggle button state
-                    def toggle_channel(url=channel_url, btn=action_btn, label=ch_label, username=channel['username'], camp=campaign):
-                        if self._is_channel_in_list(url):
-                            # Remove
-                            self._remove_drop_channel(url)
-                            # Update button and label (icon only)
-                            btn.configure(
-                                text="+ Add",
-                                fg_color=("#3b82f6", "#2563eb"),
-                                hover_color=("#2563eb", "#1d4ed8")
-                            )
-                            label.configure(text=f"📺 {username}")
-                        else:
-                            # Add
-                            self._add_drop_channel(url, 120, camp)
-                            # Update button and label (icon only)
-                            btn.configure(
-                                text="✗ Remove",
-                                fg_color=("#ef4444", "#dc2626"),
-                                hover_color=("#dc2626", "#b91c1c")
-                            )
-                            label.configure(text=f"✓ {username}")
-                    
-                    action_btn.configure(command=toggle_channel)
 
                 # "Add/Remove All Channels" button - toggle based on state
                 add_all_btn = None
+                # Translated once per card; the click handlers below reuse them
+                bulk_texts = (
+                    f"✨ {self.t('btn_add_all_channels')}",
+                    f"✨ {self.t('btn_remove_all_channels')}",
+                )
                 if len(campaign["channels"]) > 1:
                     # Check if all channels are added
-                    all_added = all(self._is_channel_in_list(ch['url']) for ch in campaign["channels"])
+                    all_added = all(ch['url'] in added_urls for ch in campaign["channels"])
                     
                     add_all_btn = ctk.CTkButton(
                         channels_frame,
-                        text=f"✨ {self.t('btn_remove_all_channels')}" if all_added else f"✨ {self.t('btn_add_all_channels')}",
+                        text=bulk_texts[1] if all_added else bulk_texts[0],
                         height=32,
-                        font=ctk.CTkFont(size=12, weight="bold"),
-                        fg_color=("#ef4444", "#dc2626") if all_added else ("#10b981", "#059669"),
-                        hover_color=("#dc2626", "#b91c1c") if all_added else ("#059669", "#047857"),
+                        font=self._font(size=12, weight="bold"),
+                        **(_BULK_REMOVE_STYLE if all_added else _BULK_ADD_STYLE),
                         corner_radius=8,
                     )
                     add_all_btn.grid(
@@ -3588,92 +4457,59 @@ class App(ctk.CTk):
                     # Function for add/remove all with individual button updates
                     def toggle_all_channels(c=campaign, bulk_btn=add_all_btn, btn_refs=channel_buttons):
                         # Check if all are added
-                        all_added = all(self._is_channel_in_list(ch['url']) for ch in c["channels"])
+                        all_added = self._all_channels_queued(c)
                         
                         if all_added:
-                            # Remove all
-                            for ch in c["channels"]:
-                                self._remove_drop_channel(ch['url'])
-                            # Update bulk button
-                            bulk_btn.configure(
-                                text=f"✨ {translate(self.config_data.language, 'btn_add_all_channels')}",
-                                fg_color=("#10b981", "#059669"),
-                                hover_color=("#059669", "#047857")
-                            )
-                            # Update all displayed individual buttons
-                            for url, btn, label, username in btn_refs:
-                                btn.configure(
-                                    text="+ Add",
-                                    fg_color=("#3b82f6", "#2563eb"),
-                                    hover_color=("#2563eb", "#1d4ed8")
-                                )
-                                label.configure(text=f"📺 {username}")
+                            # Remove all in one batch (one save, one list refresh)
+                            self._remove_drop_channels([ch['url'] for ch in c["channels"]])
+                            bulk_text = bulk_texts[0]
+                            bulk_style, btn_text, btn_style, icon = _BULK_ADD_STYLE, "+ Add", _CHANNEL_ADD_STYLE, "📺"
                         else:
                             # Add all
                             self._add_all_campaign_channels(c)
-                            # Update bulk button
-                            bulk_btn.configure(
-                                text=f"✨ {translate(self.config_data.language, 'btn_remove_all_channels')}",
-                                fg_color=("#ef4444", "#dc2626"),
-                                hover_color=("#dc2626", "#b91c1c")
-                            )
-                            # Update all displayed individual buttons
-                            for url, btn, label, username in btn_refs:
-                                btn.configure(
-                                    text="✗ Remove",
-                                    fg_color=("#ef4444", "#dc2626"),
-                                    hover_color=("#dc2626", "#b91c1c")
-                                )
-                                label.configure(text=f"✓ {username}")
+                            bulk_text = bulk_texts[1]
+                            bulk_style, btn_text, btn_style, icon = _BULK_REMOVE_STYLE, "✗ Remove", _CHANNEL_REMOVE_STYLE, "✓"
+                        # Update bulk button and all displayed individual buttons, one configure each
+                        bulk_btn.configure(text=bulk_text, **bulk_style)
+                        for url, btn, label, username in btn_refs:
+                            btn.configure(text=btn_text, **btn_style)
+                            label.configure(text=f"{icon} {username}")
                     
                     add_all_btn.configure(command=toggle_all_channels)
                 
                 # Now configure individual button commands (with access to bulk_btn)
                 for url, btn, label, username in channel_buttons:
-                    def make_toggle(url=url, btn=btn, label=label, username=username, c=campaign, bulk_btn=add_all_btn, btn_refs=channel_buttons):
-                        def toggle():
-                            if self._is_channel_in_list(url):
-                                # Remove
-                                self._remove_drop_channel(url)
-                                btn.configure(
-                                    text="+ Add",
-                                    fg_color=("#3b82f6", "#2563eb"),
-                                    hover_color=("#2563eb", "#1d4ed8")
-                                )
-                                label.configure(text=f"📺 {username}")
-                            else:
-                                # Add
-                                self._add_drop_channel(url, 120, c)
-                                btn.configure(
-                                    text="✗ Remove",
-                                    fg_color=("#ef4444", "#dc2626"),
-                                    hover_color=("#dc2626", "#b91c1c")
-                                )
-                                label.configure(text=f"✓ {username}")
-                            
-                            # Check if all channels are now added and update bulk button
-                            if bulk_btn:
-                                all_now_added = all(self._is_channel_in_list(ch['url']) for ch in c["channels"])
-                                if all_now_added:
-                                    bulk_btn.configure(
-                                        text=f"✨ {translate(self.config_data.language, 'btn_remove_all_channels')}",
-                                        fg_color=("#ef4444", "#dc2626"),
-                                        hover_color=("#dc2626", "#b91c1c")
-                                    )
-                                else:
-                                    bulk_btn.configure(
-                                        text=f"✨ {translate(self.config_data.language, 'btn_add_all_channels')}",
-                                        fg_color=("#10b981", "#059669"),
-                                        hover_color=("#059669", "#047857")
-                                    )
-                        return toggle
-                    
-                    btn.configure(command=make_toggle())
+                    btn.configure(
+                        command=functools.partial(
+                            self._toggle_drop_channel_row,
+                            url, btn, label, username, campaign, add_all_btn, bulk_texts,
+                        )
+                    )
         except Exception as e:
             print(f"Error creating campaign display: {e}")
             import traceback
             traceback.print_exc()
 
+    def _toggle_drop_channel_row(self, url, btn, label, username, campaign, bulk_btn, bulk_texts):
+        """Add/remove one campaign channel from its card and refresh the row and bulk button"""
+        if self._is_channel_in_list(url):
+            # Remove
+            self._remove_drop_channel(url)
+            btn.configure(text="+ Add", **_CHANNEL_ADD_STYLE)
+            label.configure(text=f"📺 {username}")
+        else:
+            # Add
+            self._add_drop_channel(url, 120, campaign)
+            btn.configure(text="✗ Remove", **_CHANNEL_REMOVE_STYLE)
+            label.configure(text=f"✓ {username}")
+        
+        # Check if all channels are now added and update bulk button
+        if bulk_btn:
+            if self._all_channels_queued(campaign):
+                bulk_btn.configure(text=bulk_texts[1], **_BULK_REMOVE_STYLE)
+            else:
+                bulk_btn.configure(text=bulk_texts[0], **_BULK_ADD_STYLE)
+
     def _setup_progress_tab(self, parent, drops_window):
         """Sets up the progress tab UI"""
         parent.grid_columnconfigure(0, weight=1)
@@ -3716,14 +4552,11 @@ class App(ctk.CTk):
         self._refresh_progress(scrollable_frame, status_label)
         
         # Bring window to front after loading
-        def load_and_focus():
-            try:
-                drops_window.lift()
-                drops_window.focus_force()
-            except:
-                pass
-        
-        threading.Thread(target=load_and_focus, daemon=True).start()
+        try:
+            drops_window.lift()
+            drops_window.focus_force()
+        except:
+            pass
 
     def _refresh_progress(self, scrollable_frame, status_label):
         """Fetches and displays drop progress"""
@@ -3737,80 +4570,75 @@ class App(ctk.CTk):
         
         def display_progress():
             try:
-                result = fetch_drops_progress()
-                progress_data = result.get("progress", [])
-                progress_data = [p for p in progress_data if isinstance(p, dict)]
-                driver = result.get("driver")
+                result = fetch_drops_progress(driver=self._api_driver())
+                # Group by status in a single pass, skipping malformed entries
+                in_progress, claimed = [], []
+                total = 0
+                for p in result.get("progress", []):
+                    if not isinstance(p, dict):
+                        continue
+                    total += 1
+                    status = p.get("status")
+                    if status == "in progress":
+                        in_progress.append(p)
+                    elif status == "claimed":
+                        claimed.append(p)
+
+                if not total:
+                    def show_error():
+                        status_label.configure(text=self.t("drops_progress_error"))
+                        no_data_label = ctk.CTkLabel(
+                            scrollable_frame,
+                            text=self.t("drops_progress_no_data"),
+                            font=self._font(size=12),
+                            text_color="gray",
+                        )
+                        no_data_label.grid(row=0, column=0, pady=20)
+                    self.after(0, show_error)
+                    return
                 
-                try:
-                    if not progress_data:
-                        def show_error():
-                            status_label.configure(text=self.t("drops_progress_error"))
-                            no_data_label = ctk.CTkLabel(
-                                scrollable_frame,
-                                text=self.t("drops_progress_no_data"),
-                                font=ctk.CTkFont(size=12),
-                                text_color="gray",
-                            )
-                            no_data_label.grid(row=0, column=0, pady=20)
-                        self.after(0, show_error)
-                        return
-                    
-                    # Group by status
-                    in_progress = [p for p in progress_data if p.get("status") == "in progress"]
-                    claimed = [p for p in progress_data if p.get("status") == "claimed"]
+                active = len(in_progress)
+                
+                def update_ui():
+                    status_label.configure(
+                        text=self.t("drops_progress_loaded", total=total, active=active)
+                    )
                     
-                    total = len(progress_data)
-                    active = len(in_progress)
+                    row_idx = 0
                     
-                    def update_ui():
-                        status_label.configure(
-                            text=self.t("drops_progress_loaded", total=total, active=active)
+                    # Display in-progress campaigns
+                    if in_progress:
+                        section_label = ctk.CTkLabel(
+                            scrollable_frame,
+                            text=self.t("drops_progress_in_progress"),
+                            font=self._font(size=14, weight="bold"),
                         )
+                        section_label.grid(row=row_idx, column=0, sticky="w", padx=20, pady=(20, 10))
+                        row_idx += 1
                         
-                        row_idx = 0
-                        
-                        # Display in-progress campaigns
-                        if in_progress:
-                            section_label = ctk.CTkLabel(
-                                scrollable_frame,
-                                text=self.t("drops_progress_in_progress"),
-                                font=ctk.CTkFont(size=14, weight="bold"),
-                            )
-                            section_label.grid(row=row_idx, column=0, sticky="w", padx=20, pady=(20, 10))
+                        for campaign in in_progress:
+                            self._create_progress_card(scrollable_frame, campaign, row_idx)
                             row_idx += 1
-                            
-                            for campaign in in_progress:
-                                self._create_progress_card(scrollable_frame, campaign, row_idx)
-                                row_idx += 1
+                    
+                    # Display claimed campaigns
+                    if claimed:
+                        if in_progress:
+                            row_idx += 1  # Spacing
                         
-                        # Display claimed campaigns
-                        if claimed:
-                            if in_progress:
-                                row_idx += 1  # Spacing
-                            
-                            section_label = ctk.CTkLabel(
-                                scrollable_frame,
-                                text=self.t("drops_progress_claimed"),
-                                font=ctk.CTkFont(size=14, weight="bold"),
-                            )
-                            section_label.grid(row=row_idx, column=0, sticky="w", padx=20, pady=(20, 10))
+                        section_label = ctk.CTkLabel(
+                            scrollable_frame,
+                            text=self.t("drops_progress_claimed"),
+                            font=self._font(size=14, weight="bold"),
+                        )
+                        section_label.grid(row=row_idx, column=0, sticky="w", padx=20, pady=(20, 10))
+                        row_idx += 1
+                        
+                        for campaign in claimed:
+                            self._create_progress_card(scrollable_frame, campaign, row_idx)
                             row_idx += 1
-                            
-                            for campaign in claimed:
-                                self._create_progress_card(scrollable_frame, campaign, row_idx)
-                                row_idx += 1
-                    
-                    self.after(0, update_ui)
-                            
-                finally:
-                    # Close driver after UI is rendered
-                    if driver:
-                        try:
-                            driver.quit()
-                        except:
-                            pass
-                            
+                
+                self.after(0, update_ui)
+
             except Exception as e:
                 print(f"Error displaying progress: {e}")
                 import traceback
@@ -3819,8 +4647,8 @@ class App(ctk.CTk):
                     status_label.configure(text=self.t("drops_progress_error"))
                 self.after(0, show_error)
         
-        # Run in thread to avoid blocking UI
-        threading.Thread(target=display_progress, daemon=True).start()
+        # Run on the browser thread to avoid blocking UI
+        self._browser_pool.submit(display_progress)
 
     def _create_progress_card(self, parent, campaign, row):
         """Creates a card displaying campaign progress"""
@@ -3904,49 +4732,27 @@ class App(ctk.CTk):
 
     def _is_channel_in_list(self, url):
         """Check if a URL is already in the list"""
-        return any(item["url"] == url for item in self.config_data.items)
+        return self.config_data.index_of_url(url) is not None
+
+    def _all_channels_queued(self, campaign):
+        """True if every channel of campaign is in the list"""
+        return all(self._is_channel_in_list(ch["url"]) for ch in campaign["channels"])
     
     def _find_channel_index(self, url):
         """Find the index of a URL in the list"""
-        for idx, item in enumerate(self.config_data.items):
-            if item["url"] == url:
-                return idx
-        return None
+        return self.config_data.index_of_url(url)
 
     def _add_drop_channel(self, url, minutes=120, campaign=None):
         """Add a drop channel to the queue with campaign info"""
         try:
             campaign_id = campaign.get("id") if campaign else None
-            campaign_channels = [
-                {"url": ch["url"], "username": ch.get("username", "")} 
-                for ch in campaign.get("channels", [])
-            ] if campaign else []
-            
-            # Calculate max required time from rewards if campaign has rewards
-            if campaign:
-                rewards = campaign.get("rewards", [])
-                if rewards:
-                    max_required = 0
-                    for reward in rewards:
-                        required_units = reward.get("required_units", 0)
-                        if required_units > max_required:
-                            max_required = required_units
-                    if max_required > 0:
-                        minutes = max_required
+            campaign_channels = _campaign_channel_refs(campaign) if campaign else []
             
-            # Get category_id from campaign
+            # Max required time from rewards and category_id from campaign
             required_category_id = None
             if campaign:
-                category = campaign.get("category", {})
-                if isinstance(category, dict):
-                    required_category_id = category.get("id")
-                else:
-                    # Try from progress_data
-                    progress_data = campaign.get("progress_data", {})
-                    if isinstance(progress_data, dict):
-                        progress_category = progress_data.get("category", {})
-                        if isinstance(progress_category, dict):
-                            required_category_id = progress_category.get("id")
+                minutes = _campaign_minutes(campaign, default=minutes)
+                required_category_id = _campaign_category_id(campaign)
             
             self.config_data.add(
                 url, 
@@ -3954,8 +4760,10 @@ class App(ctk.CTk):
                 campaign_id, 
                 campaign_channels,
                 required_category_id=required_category_id,
-                is_global_drop=False  # Regular drop, not global
+                is_global_drop=False,  # Regular drop, not global
+                save=False,
             )
+            self._mark_dirty()
             self.refresh_list()
             self.status_var.set(self.t("drops_added", channel=url.split("/")[-1]))
             # Auto-start if enabled and queue not running
@@ -3966,23 +4774,34 @@ class App(ctk.CTk):
     
     def _remove_drop_channel(self, url):
         """Remove a channel from the queue"""
-        try:
-            idx = self._find_channel_index(url)
-            if idx is not None:
-                self.config_data.remove(idx)
-                if idx in self.workers:
-                    self.workers[idx].stop()
-                    del self.workers[idx]
-                # Re-index workers
-                self.workers = {
-                    new_i: self.workers[old_i]
-                    for new_i, old_i in enumerate(sorted(self.workers.keys()))
-                    if old_i < len(self.config_data.items)
-                }
-                self.refresh_list()
-                self.status_var.set(f"Removed: {url.split('/')[-1]}")
-        except Exception as e:
-            print(f"Error removing channel: {e}")
+        self._remove_drop_channels([url])
+
+    def _remove_drop_channels(self, urls):
+        """Remove channels from the queue with a single save and list refresh"""
+        removed = []
+        for url in urls:
+            try:
+                idx = self._find_channel_index(url)
+                if idx is None:
+                    continue
+                uid = self.config_data.items[idx]["uid"]
+                self.config_data.remove(idx, save=False)
+                worker = self.workers.pop(uid, None)
+                if worker:
+                    worker.stop()
+                removed.append(url)
+            except Exception as e:
+                print(f"Error removing channel: {e}")
+        if not removed:
+            return
+        self._rebuild_campaign_cumulative()
+        self._mark_dirty()
+        self.refresh_list()
+        self._wake_offline_retry()  # A removed running channel frees the slot
+        if len(removed) == 1:
+            self.status_var.set(f"Removed: {removed[0].split('/')[-1]}")
+        else:
+            self.status_var.set(f"Removed {len(removed)} channel(s)")
 
     def _add_all_campaign_channels(self, campaign):
         """Add all channels from a campaign with campaign grouping"""
@@ -3990,52 +4809,30 @@ class App(ctk.CTk):
         campaign_id = campaign.get("id")
         all_channels = campaign.get("channels", [])
         
-        # Calculate max required time from rewards if campaign has rewards
-        minutes = 120  # Default
-        rewards = campaign.get("rewards", [])
-        if rewards:
-            max_required = 0
-            for reward in rewards:
-                required_units = reward.get("required_units", 0)
-                if required_units > max_required:
-                    max_required = required_units
-            if max_required > 0:
-                minutes = max_required
-        
-        # Get category_id from campaign
-        required_category_id = None
-        category = campaign.get("category", {})
-        if isinstance(category, dict):
-            required_category_id = category.get("id")
-        else:
-            # Try from progress_data
-            progress_data = campaign.get("progress_data", {})
-            if isinstance(progress_data, dict):
-                progress_category = progress_data.get("category", {})
-                if isinstance(progress_category, dict):
-                    required_category_id = progress_category.get("id")
+        # Max required time from rewards and category_id from campaign
+        minutes = _campaign_minutes(campaign)
+        required_category_id = _campaign_category_id(campaign)
         
+        # Store all channels as alternatives for each other
+        campaign_channels = _campaign_channel_refs(campaign)
         for channel in all_channels:
             try:
                 url = channel.get("url") if isinstance(channel, dict) else channel
-                # Store all channels as alternatives for each other
-                campaign_channels = [
-                    {"url": ch.get("url") if isinstance(ch, dict) else ch, 
-                     "username": ch.get("username", "") if isinstance(ch, dict) else ""}
-                    for ch in all_channels
-                ]
                 self.config_data.add(
                     url, 
                     minutes, 
                     campaign_id, 
                     campaign_channels,
                     required_category_id=required_category_id,
-                    is_global_drop=False  # Regular drop, not global
+                    is_global_drop=False,  # Regular drop, not global
+                    save=False,
                 )
                 count += 1
             except Exception as e:
                 print(f"Error adding channel {channel.get('username', 'unknown')}: {e}")
 
+        if count:
+            self._mark_dirty()
         self.refresh_list()
         self.status_var.set(f"Added {count} channel(s) from {campaign['name']}")
         # Auto-start if enabled and queue not running
@@ -4044,92 +4841,86 @@ class App(ctk.CTk):
 
     def _create_tooltip(self, widget, text):
         """Create a tooltip that displays on widget hover"""
-        tooltip = None
-
-        def on_enter(event):
-            nonlocal tooltip
-            x = widget.winfo_rootx() + widget.winfo_width() // 2
-            y = widget.winfo_rooty() - 10
-
-            tooltip = tk.Toplevel(widget)
+        widget.bind("<Enter>", functools.partial(self._show_tooltip, widget, text))
+        widget.bind("<Leave>", self._hide_tooltip)
+        # <Leave> never fires if the card is rebuilt or closed under the pointer
+        widget.bind("<Destroy>", self._hide_tooltip, add="+")
+
+    def _show_tooltip(self, widget, text, event=None):
+        """Show the app's single tooltip window with text, centered above widget"""
+        tooltip = self._tooltip
+        if tooltip is None or not tooltip.winfo_exists():
+            tooltip = self._tooltip = tk.Toplevel(self)
             tooltip.wm_overrideredirect(True)
             tooltip.wm_attributes("-topmost", True)
             
             # Frame with shadow (modern effect)
-            frame = tk.Frame(
-                tooltip,
-                background="#1f2937" if self.config_data.dark_mode else "#ffffff",
-                relief="flat",
-                borderwidth=0
-            )
-            frame.pack(padx=2, pady=2)
+            self._tooltip_frame = tk.Frame(tooltip, relief="flat", borderwidth=0)
+            self._tooltip_frame.pack(padx=2, pady=2)
             
-            label = tk.Label(
-                frame,
-                text=text,
+            self._tooltip_label = tk.Label(
+                self._tooltip_frame,
                 justify="center",
-                background="#1f2937" if self.config_data.dark_mode else "#ffffff",
-                foreground="#f9fafb" if self.config_data.dark_mode else "#111827",
                 font=("Segoe UI", 10, "bold"),
                 padx=12,
                 pady=8,
             )
-            label.pack()
-            
-            # Center tooltip above widget
-            tooltip.update_idletasks()
-            tooltip_width = tooltip.winfo_width()
-            tooltip.wm_geometry(f"+{x - tooltip_width // 2}+{y - tooltip.winfo_height() - 10}")
-
-        def on_leave(event):
-            nonlocal tooltip
-            if tooltip:
-                tooltip.destroy()
-                tooltip = None
-
-        widget.bind("<Enter>", on_enter)
-        widget.bind("<Leave>", on_leave)
+            self._tooltip_label.pack()
+        
+        background = "#1f2937" if self.config_data.dark_mode else "#ffffff"
+        self._tooltip_frame.configure(background=background)
+        self._tooltip_label.configure(
+            text=text,
+            background=background,
+            foreground="#f9fafb" if self.config_data.dark_mode else "#111827",
+        )
+        tooltip.deiconify()
+        
+        # Center tooltip above widget
+        x = widget.winfo_rootx() + widget.winfo_width() // 2
+        y = widget.winfo_rooty() - 10
+        tooltip.update_idletasks()
+        tooltip_width = tooltip.winfo_width()
+        tooltip.wm_geometry(f"+{x - tooltip_width // 2}+{y - tooltip.winfo_height() - 10}")
+
+    def _hide_tooltip(self, event=None):
+        if self._tooltip is not None:
+            try:
+                self._tooltip.withdraw()
+            except Exception:
+                pass
 
     # ----------- Toggles -----------
     def on_toggle_mute(self):
         self.config_data.mute = bool(self.mute_var.get())
-        self.config_data.save()
+        self._mark_dirty()
+        # Workers re-apply their player state on their next one-second tick
         for w in list(self.workers.values()):
-            try:
-                w.mute = self.config_data.mute
-                w.ensure_player_state()
-            except Exception:
-                pass
+            w.mute = self.config_data.mute
 
     def on_toggle_hide(self):
         self.config_data.hide_player = bool(self.hide_player_var.get())
-        self.config_data.save()
+        self._mark_dirty()
+        # Workers re-apply their player state on their next one-second tick
         for w in list(self.workers.values()):
-            try:
-                w.hide_player = self.config_data.hide_player
-                w.ensure_player_state()
-            except Exception:
-                pass
+            w.hide_player = self.config_data.hide_player
 
     def on_toggle_mini(self):
         self.config_data.mini_player = bool(self.mini_player_var.get())
-        self.config_data.save()
+        self._mark_dirty()
+        # Workers re-apply their player state on their next one-second tick
         for w in list(self.workers.values()):
-            try:
-                w.mini_player = self.config_data.mini_player
-                w.ensure_player_state()
-            except Exception:
-                pass
+            w.mini_player = self.config_data.mini_player
 
     def on_toggle_force_160p(self):
         self.config_data.force_160p = bool(self.force_160p_var.get())
-        self.config_data.save()
+        self._mark_dirty()
         # Note: force_160p only affects new streams (set during initialization)
         # Existing streams will need to be restarted to apply the change
 
     def on_toggle_auto_start(self):
         self.config_data.auto_start = bool(self.auto_start_var.get())
-        self.config_data.save()
+        self._mark_dirty()
         if self.config_data.auto_start and not self.queue_running:
             # Auto-start if enabled and queue not running
             if self.config_data.items:
@@ -4146,105 +4937,191 @@ class App(ctk.CTk):
                 self.start_all_in_order()
 
     def _start_offline_retry_monitor(self):
-        """Background thread that periodically checks offline streams and retries them"""
-        def monitor():
-            while True:
-                time.sleep(30)  # Check every 30 seconds
-                try:
-                    if not self.queue_running:
-                        continue
-                    
-                    # Only check if we're not currently running a stream
-                    # (Kick only allows 1 stream at a time)
-                    if len(self.workers) > 0:
-                        continue
-                    
-                    # Find next unfinished item
-                    for idx, item in enumerate(self.config_data.items):
-                        if item.get("finished"):
-                            continue
-                        
-                        if idx in self.workers:
-                            continue  # Already running
-                        
-                        # Check if stream is now live
-                        if kick_is_live_by_api(item["url"]):
-                            # Stream is back online, retry it
-                            self.after(0, lambda i=idx: self._start_index(i))
-                            break  # Only start one at a time
-                except Exception as e:
-                    print(f"Monitor error: {e}")
-                    time.sleep(60)  # Wait longer on error
-        
-        thread = threading.Thread(target=monitor, daemon=True)
-        thread.start()
+        """Periodically re-check offline items on the Tk loop and retry one that came back"""
+        self._retry_tick_id = self.after(30_000, self._offline_retry_tick)
+
+    def _wake_offline_retry(self, delay=1000):
+        """Run the retry check soon instead of waiting out the 30s period"""
+        tick_id = getattr(self, "_retry_tick_id", None)
+        if tick_id is None:
+            return  # Monitor not started yet
+        self.after_cancel(tick_id)
+        self._retry_tick_id = self.after(delay, self._offline_retry_tick)
+
+    def _offline_retry_tick(self):
+        self._retry_tick_id = self.after(30_000, self._offline_retry_tick)  # Check every 30 seconds
+        if not self.queue_running or self._retry_round is not None:
+            return
+        # Only check if we're not currently running or starting a stream
+        # (Kick only allows 1 stream at a time)
+        if self.workers or self._starting:
+            return
+
+        pending = [
+            (item["uid"], item["url"])
+            for item in self.config_data.items
+            if not item.get("finished") and item["uid"] not in self.workers
+        ]
+        if not pending:
+            return
+
+        # Probe all candidates in parallel; results come back through after()
+        round_ = self._retry_round = {"order": [uid for uid, _ in pending], "results": {}}
+        for uid, url in pending:
+            # max_age=0: always probe fresh, but refresh the cache the start path reads
+            fut = self._probe_pool.submit(self._is_live_cached, url, 0)
+            fut.add_done_callback(
+                lambda f, u=uid: self._post_to_ui(self._on_retry_probe_result, round_, u, f)
+            )
+
+    def _set_status_later(self, label, text):
+        """Show text on label within 100ms; newer text replaces any still pending (any thread)"""
+        with self._status_lock:
+            self._status_pending[label] = text
+            if self._status_flush_scheduled:
+                return
+            self._status_flush_scheduled = True
+        # The 100ms timer itself is armed on the Tk thread
+        self._post_to_ui(self.after, 100, self._flush_status)
+
+    def _flush_status(self):
+        with self._status_lock:
+            self._status_flush_scheduled = False
+            pending, self._status_pending = self._status_pending, {}
+        for label, text in pending.items():
+            try:
+                label.configure(text=text)
+            except Exception:
+                pass  # Window closed meanwhile
+
+    def _post_to_ui(self, func, *args):
+        """Schedule func on the Tk thread with after(0); errors raised once the window
+        is destroyed are ignored. The after() call itself runs on the caller's thread."""
+        try:
+            self.after(0, func, *args)
+        except Exception:
+            pass
+
+    def _on_retry_probe_result(self, round_, uid, fut):
+        if round_ is not self._retry_round:
+            return
+        try:
+            live = bool(fut.result())
+        except Exception:
+            live = False
+        round_["results"][uid] = live
+        if len(round_["results"]) < len(round_["order"]):
+            return
+        self._retry_round = None
+        if not self.queue_running or self.workers or self._starting:
+            return
+        # Retry the first item (in list order) that is back online
+        for uid in round_["order"]:
+            if not round_["results"].get(uid):
+                continue
+            idx = self._index_of_uid(uid)
+            if idx is not None and not self.config_data.items[idx].get("finished"):
+                self.queue_current_idx = idx
+                self._start_index(idx)
+            break  # Only start one at a time
 
     # ----------- Callbacks Worker -----------
-    def on_worker_update(self, idx, seconds, live):
-        def ui_update():
-            if idx < 0 or idx >= len(self.config_data.items):
+    def on_worker_update(self, uid, seconds, live):
+        # Called from worker threads; only the latest tick per worker is kept and
+        # applied at most ~10 times a second
+        with self._worker_ticks_lock:
+            self._worker_ticks[uid] = (seconds, live)
+            if self._worker_ticks_scheduled:
                 return
+            self._worker_ticks_scheduled = True
+        # This still calls after() from the worker thread, so it is no thread-safety
+        # guarantee; _post_to_ui only keeps a TclError from a destroyed window from
+        # escaping here. The 100 ms timer itself is then armed on the Tk thread.
+        self._post_to_ui(self.after, 100, self._flush_worker_ticks)
+
+    def _flush_worker_ticks(self):
+        with self._worker_ticks_lock:
+            self._worker_ticks_scheduled = False
+            ticks, self._worker_ticks = self._worker_ticks, {}
+        for uid, (seconds, live) in ticks.items():
+            self._apply_worker_tick(uid, seconds, live)
+
+    def _apply_worker_tick(self, uid, seconds, live):
+        idx = self._index_of_uid(uid)
+        if idx is None:
+            return
+        
+        item = self.config_data.items[idx]
+        is_global_drop = item.get("is_global_drop", False)
+        
+        if self.tree.exists(uid):
+            tag = self.t("tag_live") if live else self.t("tag_paused")
             
-            item = self.config_data.items[idx]
-            is_global_drop = item.get("is_global_drop", False)
-            
-            if str(idx) in self.tree.get_children():
-                values = list(self.tree.item(str(idx), "values"))
-                tag = self.t("tag_live") if live else self.t("tag_paused")
-                
-                if is_global_drop:
-                    # Show cumulative time for global drops
-                    cumulative_seconds = item.get("cumulative_time", 0) + seconds
-                    cumulative_minutes = cumulative_seconds // 60
-                    values[2] = f"{cumulative_minutes}m ({tag})"
-                else:
-                    # Regular drop - show individual time
-                    values[2] = f"{seconds}s ({tag})"
-                
-                current_tags = set(self.tree.item(str(idx), "tags") or [])
-                if live:
-                    current_tags.discard("paused")
-                else:
-                    current_tags.add("paused")
-                self.tree.item(str(idx), values=values, tags=tuple(current_tags))
-            
-            # Update status bar with elapsed time
             if is_global_drop:
+                # Show cumulative time for global drops
                 cumulative_seconds = item.get("cumulative_time", 0) + seconds
                 cumulative_minutes = cumulative_seconds // 60
-                secs = cumulative_seconds % 60
-                time_str = f"{cumulative_minutes}m {secs}s" if cumulative_minutes > 0 else f"{secs}s"
-                status = self.t("tag_live") if live else self.t("tag_paused")
-                
-                if self.queue_running and self.queue_current_idx == idx:
-                    self.status_var.set(f"{self.t('queue_running_status', url=item['url'])} - {time_str} cumulative ({status})")
-                else:
-                    self.status_var.set(f"{self.t('status_playing', url=item['url'])} - {time_str} cumulative ({status})")
+                elapsed_text = f"{cumulative_minutes}m ({tag})"
             else:
-                minutes = seconds // 60
-                secs = seconds % 60
-                time_str = f"{minutes}m {secs}s" if minutes > 0 else f"{secs}s"
-                status = self.t("tag_live") if live else self.t("tag_paused")
-                
-                if self.queue_running and self.queue_current_idx == idx:
-                    self.status_var.set(f"{self.t('queue_running_status', url=item['url'])} - {time_str} ({status})")
-                else:
-                    self.status_var.set(f"{self.t('status_playing', url=item['url'])} - {time_str} ({status})")
-
-        self.after(0, ui_update)
+                # Regular drop - show individual time
+                elapsed_text = f"{seconds}s ({tag})"
+            old_tags = self._row_tags(uid)
+            current_tags = set(old_tags)
+            if live:
+                current_tags.discard("paused")
+            else:
+                current_tags.add("paused")
+            # Only the elapsed cell changes on most ticks, and nothing at all on some
+            if current_tags != set(old_tags):
+                self._queue_row_update(uid, tags=current_tags, elapsed=elapsed_text)
+            elif self._row_value(uid, "elapsed") != elapsed_text:
+                self._queue_row_update(uid, elapsed=elapsed_text)
+        
+        # Update status bar with elapsed time
+        if is_global_drop:
+            cumulative_seconds = item.get("cumulative_time", 0) + seconds
+            cumulative_minutes = cumulative_seconds // 60
+            secs = cumulative_seconds % 60
+            time_str = f"{cumulative_minutes}m {secs}s" if cumulative_minutes > 0 else f"{secs}s"
+            status = self.t("tag_live") if live else self.t("tag_paused")
+            
+            if self.queue_running and self.queue_current_idx == idx:
+                status_text = f"{self.t('queue_running_status', url=item['url'])} - {time_str} cumulative ({status})"
+            else:
+                status_text = f"{self.t('status_playing', url=item['url'])} - {time_str} cumulative ({status})"
+        else:
+            minutes = seconds // 60
+            secs = seconds % 60
+            time_str = f"{minutes}m {secs}s" if minutes > 0 else f"{secs}s"
+            status = self.t("tag_live") if live else self.t("tag_paused")
+            
+            if self.queue_running and self.queue_current_idx == idx:
+                status_text = f"{self.t('queue_running_status', url=item['url'])} - {time_str} ({status})"
+            else:
+                status_text = f"{self.t('status_playing', url=item['url'])} - {time_str} ({status})"
+        
+        # Setting the same text still makes the status bar redraw
+        if self.status_var.get() != status_text:
+            self.status_var.set(status_text)
 
-    def on_worker_finish(self, idx, elapsed, completed):
+    def on_worker_finish(self, uid, worker, elapsed, completed):
         def ui_finish():
-            if idx < 0 or idx >= len(self.config_data.items):
+            idx = self._index_of_uid(uid)
+            if idx is None:
                 return
 
-            worker = self.workers.get(idx)
+            # A worker replaced by _start_index is no longer registered; it must not drive the queue
+            registered = self.workers.get(uid) is worker
+            if registered:
+                del self.workers[uid]
             ended_offline = bool(worker and getattr(worker, "ended_because_offline", False))
             ended_wrong_category = bool(worker and getattr(worker, "ended_because_wrong_category", False))
             
             item = self.config_data.items[idx]
             is_global_drop = item.get("is_global_drop", False)
             campaign_id = item.get("campaign_id")
+            # Set instead of saving after each mutation; the config is written once below
+            dirty = False
             
             # Initialize completed variable
             # For regular drops, use the value passed from worker
@@ -4255,12 +5132,14 @@ class App(ctk.CTk):
             if is_global_drop and campaign_id:
                 # Add elapsed time to cumulative time for all items in this campaign
                 debug_print(f"DEBUG: Global drop - adding {elapsed} seconds to cumulative time")
-                for other_item in self.config_data.items:
-                    if other_item.get("campaign_id") == campaign_id:
-                        current_cumulative = other_item.get("cumulative_time", 0)
-                        other_item["cumulative_time"] = current_cumulative + elapsed
+                debug = _debug_enabled()
+                for other_item in self.config_data.items_for_campaign(campaign_id):
+                    current_cumulative = other_item.get("cumulative_time", 0)
+                    other_item["cumulative_time"] = current_cumulative + elapsed
+                    self._campaign_cumulative[campaign_id] += elapsed
+                    if debug:
                         debug_print(f"DEBUG: Item {other_item['url']} cumulative time: {other_item['cumulative_time']}s")
-                self.config_data.save()
+                dirty = True
                 
                 # Check if cumulative time reached target
                 target_minutes = item.get("minutes", 0)
@@ -4272,10 +5151,9 @@ class App(ctk.CTk):
                 if target_minutes > 0 and cumulative_minutes >= target_minutes:
                     # Mark all items in campaign as finished
                     debug_print(f"DEBUG: Target reached! Marking all items in campaign as finished")
-                    for other_item in self.config_data.items:
-                        if other_item.get("campaign_id") == campaign_id:
-                            other_item["finished"] = True
-                    self.config_data.save()
+                    for other_item in self.config_data.items_for_campaign(campaign_id):
+                        other_item["finished"] = True
+                    dirty = True
                     completed_value = True
                 else:
                     # Not finished yet, continue with other streamers
@@ -4287,103 +5165,136 @@ class App(ctk.CTk):
                 if not is_global_drop:
                     # Regular drop - mark individual item as finished
                     self.config_data.items[idx]["finished"] = True
-                    self.config_data.save()
+                    dirty = True
                 # Reset tried_channels on successful completion
-                self.config_data.items[idx]["tried_channels"] = []
-                self.config_data.save()
-                if str(idx) in self.tree.get_children():
-                    values = list(self.tree.item(str(idx), "values"))
+                _tried_set(self.config_data.items[idx]).clear()
+                dirty = True
+                if self.tree.exists(uid):
                     if is_global_drop:
                         cumulative_minutes = item.get("cumulative_time", 0) // 60
-                        values[2] = f"{cumulative_minutes}m ({self.t('tag_finished')})"
+                        elapsed_text = f"{cumulative_minutes}m ({self.t('tag_finished')})"
                     else:
-                        values[2] = f"{elapsed}s ({self.t('tag_finished')})"
-                    current_tags = set(self.tree.item(str(idx), "tags") or [])
+                        elapsed_text = f"{elapsed}s ({self.t('tag_finished')})"
+                    current_tags = set(self._row_tags(uid))
                     current_tags.add("finished")
                     current_tags.discard("paused")
                     current_tags.discard("redo")
-                    self.tree.item(str(idx), values=values, tags=tuple(current_tags))
+                    self._queue_row_update(uid, tags=current_tags, elapsed=elapsed_text)
             elif ended_offline or ended_wrong_category:
                 # Try alternative channel from same campaign
                 campaign_channels = item.get("campaign_channels", [])
                 
-                switched = False
+                candidates = []
+                channel_count = 0
                 if campaign_id and campaign_channels:
                     current_url = item["url"]
-                    tried_channels = item.get("tried_channels", [])
+                    tried_channels = _tried_set(item)
                     
-                    # Add current URL to tried list if not already there
-                    if current_url not in tried_channels:
-                        tried_channels.append(current_url)
+                    # Add current URL to tried set
+                    tried_channels.add(current_url)
+                    dirty = True
                     
-                    # Get all channel URLs
-                    all_channel_urls = []
-                    for ch in campaign_channels:
-                        ch_url = ch.get("url") if isinstance(ch, dict) else ch
-                        if ch_url:
-                            all_channel_urls.append(ch_url)
-                    
-                    # Also include current URL in the list
-                    if current_url not in all_channel_urls:
-                        all_channel_urls.append(current_url)
+                    # All channel URLs, including the current one
+                    all_channel_urls = {
+                        ch.get("url") if isinstance(ch, dict) else ch for ch in campaign_channels
+                    }
+                    all_channel_urls.discard(None)
+                    all_channel_urls.discard("")
+                    all_channel_urls.add(current_url)
+                    channel_count = len(all_channel_urls)
                     
                     # If we've tried all channels, reset the tried list
-                    if len(tried_channels) >= len(all_channel_urls):
+                    if len(tried_channels) >= channel_count:
                         tried_channels.clear()
                         debug_print(f"DEBUG: Reset tried_channels for campaign {campaign_id} - all channels exhausted")
                     
-                    # Find next available live channel from same campaign that hasn't been tried
+                    # Untried alternatives from the same campaign, in campaign order
                     for alt_channel in campaign_channels:
                         alt_url = alt_channel.get("url") if isinstance(alt_channel, dict) else alt_channel
                         if alt_url and alt_url != current_url and alt_url not in tried_channels:
-                            # Check if this alternative is live
-                            if kick_is_live_by_api(alt_url):
-                                # Switch to this alternative channel
-                                self.config_data.items[idx]["url"] = alt_url
-                                tried_channels.append(alt_url)  # Mark as tried
-                                item["tried_channels"] = tried_channels  # Update item
-                                self.config_data.save()
-                                self.refresh_list()
-                                switched = True
-                                debug_print(f"DEBUG: Switched to alternative: {alt_url} (tried: {len(tried_channels)}/{len(all_channel_urls)})")
-                                self.status_var.set(f"Switched to alternative: {alt_url.split('/')[-1]} - waiting for page to load...")
-                                
-                                # Retry with new channel if queue is running
-                                # Wait 8 seconds to allow browser to fully load the new stream
-                                if getattr(self, "queue_running", False):
-                                    self.after(8000, lambda i=idx: self._start_index(i))
-                                    return
-                                break
-                    
-                    # If no live alternative found, but we haven't tried all channels, mark current as tried and wait
-                    if not switched and len(tried_channels) < len(all_channel_urls):
-                        item["tried_channels"] = tried_channels  # Update tried list even if no switch
-                        self.config_data.save()
-                        debug_print(f"DEBUG: No live alternatives found, but {len(all_channel_urls) - len(tried_channels)} channels remain untried")
+                            candidates.append(alt_url)
                 
-                if not switched:
-                    # No alternative found, mark for retry
-                    if str(idx) in self.tree.get_children():
-                        values = list(self.tree.item(str(idx), "values"))
-                        values[2] = f"{elapsed}s ({self.t('retry')})"
-                        current_tags = set(self.tree.item(str(idx), "tags") or [])
-                        current_tags.add("redo")
-                        current_tags.discard("paused")
-                        current_tags.discard("finished")
-                        self.tree.item(str(idx), values=values, tags=tuple(current_tags))
-                    try:
-                        self.status_var.set(
-                            self.t("offline_wait_retry", url=self.config_data.items[idx]["url"])
-                        )
-                    except Exception:
-                        pass
+                if dirty:
+                    self._save_in_background()
+                if candidates:
+                    # Probe off the Tk thread; _finish_offline_item takes over with the result
+                    threading.Thread(
+                        target=self._probe_offline_alternatives,
+                        args=(uid, registered, elapsed, candidates, channel_count),
+                        daemon=True,
+                    ).start()
+                else:
+                    self._finish_offline_item(uid, registered, elapsed, None, channel_count)
+                return
 
-            # Continue queue if applicable
-            if getattr(self, "queue_running", False) and self.queue_current_idx == idx:
-                self._run_queue_from(idx + 1)
+            if dirty:
+                self._save_in_background()
+            self._continue_queue_after(idx, registered)
 
         self.after(0, ui_finish)
 
+    def _probe_offline_alternatives(self, uid, registered, elapsed, candidates, channel_count):
+        """Background half of the alternative search in ui_finish: network probes only, no Tk calls"""
+        # Probe every untried alternative concurrently and take the first live one
+        alt_url = self._first_live_channel(candidates)
+        self._post_to_ui(self._finish_offline_item, uid, registered, elapsed, alt_url, channel_count)
+
+    def _finish_offline_item(self, uid, registered, elapsed, alt_url, channel_count):
+        """Switch an item whose stream ended to a live alternative, or mark it for retry"""
+        idx = self._index_of_uid(uid)
+        if idx is None:
+            return
+        item = self.config_data.items[idx]
+        tried_channels = _tried_set(item)
+        
+        # Another stream may have been started while probing; don't take over the queue then
+        if alt_url and not (self.workers or self._starting):
+            # Switch to this alternative channel
+            item["url"] = alt_url
+            self.config_data.invalidate_indexes()
+            tried_channels.add(alt_url)  # Mark as tried
+            self._save_in_background()
+            self._refresh_row(item)
+            debug_print(f"DEBUG: Switched to alternative: {alt_url} (tried: {len(tried_channels)}/{channel_count})")
+            self.status_var.set(f"Switched to alternative: {alt_url.split('/')[-1]} - waiting for page to load...")
+            
+            # Retry with new channel if queue is running
+            # Wait 8 seconds to allow browser to fully load the new stream
+            if getattr(self, "queue_running", False):
+                # Claim the start now so the retry monitor doesn't race the delayed restart
+                self._start_token += 1
+                self._starting = True
+                self.after(
+                    _ALT_CHANNEL_WAIT_MS,
+                    functools.partial(self._start_uid, uid, idx, self._start_token),
+                )
+                return
+        else:
+            if channel_count and len(tried_channels) < channel_count:
+                debug_print(f"DEBUG: No live alternatives found, but {channel_count - len(tried_channels)} channels remain untried")
+            # No alternative found, mark for retry
+            if self.tree.exists(uid):
+                current_tags = set(self._row_tags(uid))
+                current_tags.add("redo")
+                current_tags.discard("paused")
+                current_tags.discard("finished")
+                self._queue_row_update(
+                    uid, tags=current_tags, elapsed=f"{elapsed}s ({self.t('retry')})"
+                )
+            try:
+                self.status_var.set(self.t("offline_wait_retry", url=item["url"]))
+            except Exception:
+                pass
+        
+        self._continue_queue_after(idx, registered)
+
+    def _continue_queue_after(self, idx, registered):
+        """Move the queue on once the worker of item idx has finished"""
+        if registered and getattr(self, "queue_running", False) and self.queue_current_idx == idx:
+            self._run_queue_from(idx + 1)
+            # If nothing further could start, recheck earlier offline items right away
+            self._wake_offline_retry()
+
 
 # ===============================
 # Main